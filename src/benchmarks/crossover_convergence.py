@@ -0,0 +1,86 @@
+"""
+Compares the time needed by each crossover operator to reach a target tour length.
+
+The target is a fixed ratio above a nearest neighbor + 2-opt reference tour, so the
+numbers are comparable between instances. Every operator starts from the same
+random initial population and runs until it reaches the target or the time budget.
+Usage: cd src && python -m benchmarks.crossover_convergence [--operators ox erx eax]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from genetics.exact import route_length, two_opt
+from genetics.genetics import evolve_population
+from genetics.initialize import gen_population, get_distance_matrix, nearest_neighbor
+from genetics.parameters import Params
+from genetics.selection import calculate_fitness
+from tools.load import load_csv
+
+
+def time_to_target(distance_matrix, params, target, budget, seed):
+    """
+    Returns (seconds, generations, best length) at the moment the best tour of the
+    population is not longer than target, or when the time budget runs out.
+    """
+    rng = np.random.default_rng(seed)
+    population = gen_population("random", params.population_size, distance_matrix, rng)
+    start = time.perf_counter()
+    generation = 0
+
+    while True:
+        fitness_scores = calculate_fitness(population, distance_matrix)
+        best_length = 1 / fitness_scores.max()
+        elapsed = time.perf_counter() - start
+        if best_length <= target or elapsed > budget:
+            return elapsed, generation, best_length
+        population = evolve_population(
+            population, fitness_scores, params, rng, distance_matrix
+        )
+        generation += 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--datasets",
+        nargs="+",
+        default=["../data/cities_500_dataset.csv", "../data/cities_1000_dataset.csv"],
+    )
+    parser.add_argument("--operators", nargs="+", default=["ox", "erx", "eax"])
+    parser.add_argument("--target-ratio", type=float, default=2.0)
+    parser.add_argument("--budget", type=float, default=120.0, help="seconds per run")
+    parser.add_argument("--population-size", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for dataset in args.datasets:
+        cities = load_csv(dataset)
+        distance_matrix = get_distance_matrix(cities)
+        reference = two_opt(
+            nearest_neighbor(0, distance_matrix, len(cities)), distance_matrix
+        )
+        target = args.target_ratio * route_length(reference, distance_matrix)
+        print(f"\n{dataset}: {len(cities)} cities, target length {target:.0f}")
+        print(
+            f"{'operator':<10}{'seconds':>10}{'generations':>13}{'best':>10}  reached"
+        )
+
+        for operator in args.operators:
+            params = Params(
+                population_size=args.population_size,
+                generations=0,
+                elite_size=2,
+                tournament_size=3,
+                mutation_rate=0.02,
+                crossover_type=operator,
+            )
+            seconds, generations, best = time_to_target(
+                distance_matrix, params, target, args.budget, args.seed
+            )
+            print(
+                f"{operator:<10}{seconds:>10.1f}{generations:>13}{best:>10.0f}"
+                f"  {'yes' if best <= target else 'no'}"
+            )
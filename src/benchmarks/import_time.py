@@ -0,0 +1,54 @@
+"""
+Measures the cold-start cost of a headless solver worker.
+
+Each scenario runs in a fresh interpreter, so nothing is cached between runs.
+Usage: cd src && python -m benchmarks.import_time [repeats]
+"""
+
+import subprocess
+import sys
+import time
+
+SCENARIOS = {
+    "genetics": "import genetics",
+    "solver worker": "from genetics import run_genetic_algorithm, Params",
+    "grid search": "from tuning import search_grid",
+    "load": "from tools import load_csv",
+    "plotting": "from tools import plot_route",
+}
+
+HEAVY_MODULES = ["matplotlib", "pandas"]
+
+
+def measure(statement: str, repeats: int) -> float:
+    """
+    Returns the best wall time (in seconds) of running `statement` in a new interpreter.
+    """
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def loaded_heavy_modules(statement: str) -> list:
+    """
+    Returns the heavy optional modules that `statement` pulls into sys.modules.
+    """
+    probe = f"{statement}; import sys; print(*[m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    output = subprocess.run(
+        [sys.executable, "-c", probe], check=True, capture_output=True, text=True
+    )
+    return output.stdout.split()
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    baseline = measure("pass", repeats)
+    print(f"{'scenario':<16}{'import (ms)':>12}  heavy modules")
+
+    for name, statement in SCENARIOS.items():
+        duration = measure(statement, repeats) - baseline
+        heavy = ", ".join(loaded_heavy_modules(statement)) or "-"
+        print(f"{name:<16}{duration * 1000:>12.1f}  {heavy}")
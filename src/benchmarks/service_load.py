@@ -0,0 +1,86 @@
+"""
+Load test for the local solver service: measures job latency and throughput under
+concurrent clients. Start the service first (cd src && python -m service.server).
+Usage: cd src && python -m benchmarks.service_load [--clients 8] [--jobs 4]
+"""
+
+import argparse
+import json
+import threading
+import time
+import urllib.request
+
+import numpy as np
+
+from tools.load import load_csv
+
+
+def request(url: str, payload: dict = None) -> dict:
+    data = json.dumps(payload).encode() if payload is not None else None
+    req = urllib.request.Request(
+        url, data=data, headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(req) as response:
+        return json.loads(response.read())
+
+
+def run_client(base_url: str, payload: dict, jobs: int, poll: float, latencies: list):
+    for _ in range(jobs):
+        start = time.perf_counter()
+        job_id = request(f"{base_url}/jobs", payload)["job_id"]
+        while True:
+            job = request(f"{base_url}/jobs/{job_id}")
+            if job["status"] in ("done", "error"):
+                break
+            time.sleep(poll)
+        latencies.append((time.perf_counter() - start, job["status"]))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Solver service load test")
+    parser.add_argument("--url", default="http://127.0.0.1:8765")
+    parser.add_argument("--dataset", default="../data/cities_50_dataset.csv")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--jobs", type=int, default=4, help="jobs per client")
+    parser.add_argument("--generations", type=int, default=100)
+    parser.add_argument("--poll", type=float, default=0.05)
+    args = parser.parse_args()
+
+    payload = {
+        "cities": load_csv(args.dataset).tolist(),
+        "params": {
+            "population_size": 100,
+            "generations": args.generations,
+            "elite_size": 4,
+            "tournament_size": 5,
+            "mutation_rate": 0.05,
+        },
+        "seed": 42,
+    }
+
+    latencies = []
+    clients = [
+        threading.Thread(
+            target=run_client,
+            args=(args.url, payload, args.jobs, args.poll, latencies),
+        )
+        for _ in range(args.clients)
+    ]
+    start = time.perf_counter()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.perf_counter() - start
+
+    seconds = np.array([latency for latency, _ in latencies])
+    errors = sum(status != "done" for _, status in latencies)
+    print(f"jobs: {len(seconds)} ({errors} errors) in {elapsed:.2f}s")
+    print(f"throughput: {len(seconds) / elapsed:.2f} jobs/s")
+    print(
+        "latency (s): "
+        f"p50 {np.percentile(seconds, 50):.3f}  "
+        f"p95 {np.percentile(seconds, 95):.3f}  "
+        f"max {seconds.max():.3f}"
+    )
+    print(f"service: {request(f'{args.url}/status')}")
@@ -0,0 +1,92 @@
+"""
+Compares evaluations-to-target of the steady-state engine and the generational loop.
+
+The target is a fixed ratio above a nearest neighbor + 2-opt reference tour, as in
+benchmarks.crossover_convergence. Both engines get the same Params and evaluation
+budget (generations * population_size children) and the same seeds; the table
+reports the median number of fitness evaluations until the best tour reaches the
+target, read from the per-generation fitness history.
+Usage: cd src && python -m benchmarks.steady_state [--crossover ox] [--runs 5]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from genetics.exact import route_length, two_opt
+from genetics.genetics import run_genetic_algorithm
+from genetics.initialize import get_distance_matrix, nearest_neighbor
+from genetics.parameters import Params
+from genetics.steady_state import run_steady_state_genetic_algorithm
+from tools.load import load_csv
+
+ENGINES = {
+    "generational": run_genetic_algorithm,
+    "steady worst": lambda *a, **kw: run_steady_state_genetic_algorithm(
+        *a, replacement="worst", **kw
+    ),
+    "steady parent": lambda *a, **kw: run_steady_state_genetic_algorithm(
+        *a, replacement="parent", **kw
+    ),
+}
+
+
+def evaluations_to_target(history, target, population_size):
+    """
+    Returns the evaluations until the best length is <= target, or None.
+    """
+    reached = np.nonzero(1 / np.asarray(history) <= target)[0]
+    return (reached[0] + 1) * population_size if len(reached) else None
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dataset", default="../data/cities_100_dataset.csv")
+    parser.add_argument("--target-ratio", type=float, default=1.3)
+    parser.add_argument("--population-size", type=int, default=200)
+    parser.add_argument("--generations", type=int, default=1000)
+    parser.add_argument("--crossover", default="ox")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    cities = load_csv(args.dataset)
+    distance_matrix = get_distance_matrix(cities)
+    reference = two_opt(
+        nearest_neighbor(0, distance_matrix, len(cities)), distance_matrix
+    )
+    target = args.target_ratio * route_length(reference, distance_matrix)
+    params = Params(
+        population_size=args.population_size,
+        generations=args.generations,
+        elite_size=2,
+        tournament_size=5,
+        mutation_rate=0.05,
+        mutation_type="inversion",
+        crossover_type=args.crossover,
+        initial_population="random",
+    )
+    print(f"{args.dataset}: {len(cities)} cities, target length {target:.0f}")
+    print(f"{'engine':<15}{'evaluations':>13}{'reached':>9}{'best':>8}{'seconds':>9}")
+
+    seeds = np.random.SeedSequence(args.seed).spawn(args.runs)
+    for name, engine in ENGINES.items():
+        evaluations, bests, start = [], [], time.perf_counter()
+        for seed in seeds:
+            _, best_fitness, history, _ = engine(
+                cities,
+                params,
+                rng=np.random.default_rng(seed),
+                distance_matrix=distance_matrix,
+            )
+            evaluations.append(
+                evaluations_to_target(history, target, args.population_size)
+            )
+            bests.append(1 / best_fitness)
+        reached = [e for e in evaluations if e is not None]
+        median = f"{np.median(reached):.0f}" if reached else "-"
+        print(
+            f"{name:<15}{median:>13}{len(reached):>6}/{args.runs:<2}"
+            f"{np.median(bests):>8.0f}{(time.perf_counter() - start) / args.runs:>9.1f}"
+        )
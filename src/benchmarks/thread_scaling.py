@@ -0,0 +1,92 @@
+"""
+Measures how the chunked generation pipeline scales from 1 to N threads.
+
+For every thread count, a ChunkedExecutor evaluates and evolves the same large random
+population for a few generations; the table reports seconds per generation for
+fitness evaluation and for breeding, and the speedup over one thread. Expect a
+speedup for fitness evaluation only: breeding is bound by the GIL-holding crossover
+loop and stays near 1x.
+Usage: cd src && python -m benchmarks.thread_scaling [--population-size 20000]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from genetics.initialize import gen_population, get_distance_matrix
+from genetics.parallel import ChunkedExecutor
+from genetics.parameters import Params
+from tools.load import load_csv
+
+
+def time_generations(executor, population, distance_matrix, params, generations, seed):
+    """
+    Returns the mean (fitness, breeding) seconds per generation.
+    """
+    rng = np.random.default_rng(seed)
+    fitness_time = breeding_time = 0.0
+    for _ in range(generations):
+        start = time.perf_counter()
+        fitness_scores = executor.calculate_fitness(population, distance_matrix)
+        fitness_time += time.perf_counter() - start
+
+        start = time.perf_counter()
+        population = executor.evolve_population(
+            population, fitness_scores, params, rng, distance_matrix
+        )
+        breeding_time += time.perf_counter() - start
+    return fitness_time / generations, breeding_time / generations
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dataset", default="../data/cities_100_dataset.csv")
+    parser.add_argument("--population-size", type=int, default=20000)
+    parser.add_argument("--generations", type=int, default=5)
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument("--threads", type=int, nargs="+", default=None)
+    parser.add_argument("--crossover", default="ox")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    thread_counts = args.threads or sorted(
+        {1, 2, 4, 8, os.cpu_count()} & set(range(1, os.cpu_count() + 1))
+    )
+    cities = load_csv(args.dataset)
+    distance_matrix = get_distance_matrix(cities)
+    population = gen_population(
+        "random",
+        args.population_size,
+        distance_matrix,
+        np.random.default_rng(args.seed),
+    )
+    params = Params(
+        population_size=args.population_size,
+        generations=args.generations,
+        elite_size=10,
+        tournament_size=5,
+        mutation_rate=0.02,
+        crossover_type=args.crossover,
+    )
+
+    print(
+        f"{len(cities)} cities, {args.population_size} tours, "
+        f"chunks of {args.chunk_size}, {os.cpu_count()} CPUs"
+    )
+    print(f"{'threads':<9}{'fitness s':>11}{'breeding s':>12}{'speedup':>9}")
+    baseline = None
+    for threads in thread_counts:
+        with ChunkedExecutor(threads, args.chunk_size) as executor:
+            fitness, breeding = time_generations(
+                executor,
+                population,
+                distance_matrix,
+                params,
+                args.generations,
+                args.seed,
+            )
+        total = fitness + breeding
+        baseline = total if baseline is None else baseline
+        print(f"{threads:<9}{fitness:>11.4f}{breeding:>12.4f}{baseline / total:>9.2f}")
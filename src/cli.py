@@ -0,0 +1,174 @@
+"""
+Headless batch runner: solves one or many instance files, or whole directories, with
+parameters from a JSON config file, in parallel processes.
+
+Each result is written as one JSON line as soon as its solve finishes. matplotlib is
+only imported when --plot-dir is given.
+
+Usage:
+    cd src && python cli.py ../data/cities_50_dataset.csv --config params.json
+    cd src && python cli.py ../data --workers 4 --output results.jsonl
+    cd src && python cli.py ../data/generated/road_100000.npy --solver decomposed
+
+The config file holds Params fields, or a list of them to run every instance with
+every parameter set:
+    {"population_size": 700, "generations": 1200, "elite_size": 20,
+     "tournament_size": 20, "mutation_rate": 0.03}
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List
+
+import numpy as np
+
+from genetics.decomposition import run_decomposed_genetic_algorithm
+from genetics.genetics import run_genetic_algorithm
+from genetics.parameters import Params
+from genetics.solver import solve_tsp
+from genetics.steady_state import run_steady_state_genetic_algorithm
+from tools.load import load_csv, load_dataset, load_npy
+
+SOLVERS = {
+    "ga": run_genetic_algorithm,
+    "auto": solve_tsp,
+    "decomposed": run_decomposed_genetic_algorithm,
+    "steady": run_steady_state_genetic_algorithm,
+}
+
+DEFAULT_PARAMS = Params(
+    population_size=700,
+    generations=1200,
+    elite_size=20,
+    tournament_size=20,
+    mutation_rate=0.03,
+)
+
+
+def load_params(config_path: str = None) -> List[Params]:
+    """
+    Reads one Params object, or a list of them, from a JSON config file.
+    """
+    if config_path is None:
+        return [DEFAULT_PARAMS]
+    with open(config_path) as file:
+        config = json.load(file)
+    configs = config if isinstance(config, list) else [config]
+    return [Params(**values) for values in configs]
+
+
+def load_instances(paths: List[str], endswith: str) -> List[tuple]:
+    """
+    Returns (path, cities) for every file path and every dataset file in every directory.
+    """
+    instances = []
+    for path in paths:
+        if os.path.isdir(path):
+            instances.extend(load_dataset(path, endswith, with_paths=True))
+        elif path.endswith(".npy"):
+            instances.append((path, load_npy(path)))
+        else:
+            instances.append((path, load_csv(path)))
+    return instances
+
+
+def solve_instance(
+    path: str, cities: np.ndarray, params: Params, solver: str, seed
+) -> dict:
+    """
+    Solves one instance in a worker process and returns a JSON-serialisable record.
+    """
+    start_time = time.time()
+    result = SOLVERS[solver](cities, params, rng=np.random.default_rng(seed))
+    best_route, best_fitness, _, _ = result
+    best_fitness = float(best_fitness)
+    return {
+        "instance": path,
+        "num_cities": len(cities),
+        "solver": solver,
+        "params": vars(params),
+        "best_fitness": best_fitness,
+        "length": 1 / best_fitness if best_fitness > 0 else None,
+        "duration": time.time() - start_time,
+        "proven_optimal": getattr(result, "proven_optimal", False),
+        "best_route": np.asarray(best_route).tolist(),
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Solve TSP instances in batch without plotting."
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="instance CSV or .npy files, or directories"
+    )
+    parser.add_argument("--config", help="JSON file with Params fields (or a list)")
+    parser.add_argument("--solver", choices=sorted(SOLVERS), default="ga")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", help="JSON lines output file, default stdout")
+    parser.add_argument("--endswith", default="_dataset.csv")
+    parser.add_argument("--no-route", action="store_true", help="omit best_route")
+    parser.add_argument("--plot-dir", help="save a PNG of every best route here")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="d-%(levelname)s-%(message)s")
+    params_list = load_params(args.config)
+    instances = load_instances(args.paths, args.endswith)
+    jobs = [
+        (path, cities, params) for path, cities in instances for params in params_list
+    ]
+    seeds = np.random.SeedSequence(args.seed).spawn(len(jobs))
+    logging.info(f"Solving {len(jobs)} jobs with solver '{args.solver}'...")
+
+    output = open(args.output, "a") if args.output else sys.stdout
+    failures = 0
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(
+                    solve_instance, path, cities, params, args.solver, seed
+                ): (index, path, cities)
+                for index, ((path, cities, params), seed) in enumerate(zip(jobs, seeds))
+            }
+            for future in as_completed(futures):
+                index, path, cities = futures[future]
+                try:
+                    record = future.result()
+                except Exception as e:
+                    logging.error(f"Error solving {path}: {e}")
+                    failures += 1
+                    continue
+
+                if args.plot_dir:
+                    from tools.plot import plot_route
+
+                    os.makedirs(args.plot_dir, exist_ok=True)
+                    name = os.path.splitext(os.path.basename(path))[0]
+                    if len(params_list) > 1:
+                        name += f"_params{index % len(params_list)}"
+                    plot_route(
+                        record["best_route"],
+                        cities,
+                        title=f"{name} - length {record['length']:.0f}",
+                        save_path=os.path.join(args.plot_dir, f"{name}.png"),
+                    )
+                if args.no_route:
+                    del record["best_route"]
+
+                output.write(json.dumps(record) + "\n")
+                output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
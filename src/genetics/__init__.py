@@ -1,6 +1,58 @@
-from .genetics import run_genetic_algorithm
-from .initialize import *
-from .mutation import *
-from .crossover import *
-from .parameters import *
-from .selection import *
+from tools.lazy import lazy_module
+
+# The submodules genetics.crossover and genetics.mutation share their names with
+# these functions; importing them eagerly (numpy only) keeps the package attributes
+# bound to the functions once any other module has imported the submodules.
+from .crossover import crossover
+from .mutation import mutation
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not load every operator module up front.
+_LAZY_ATTRIBUTES = {
+    "run_genetic_algorithm": ".genetics",
+    "evolve_population": ".genetics",
+    "SolutionStore": ".solutions",
+    "instance_key": ".solutions",
+    "run_steady_state_genetic_algorithm": ".steady_state",
+    "FitnessIndex": ".steady_state",
+    "ChunkedExecutor": ".parallel",
+    "solve_tsp": ".solver",
+    "SolverResult": ".solver",
+    "AdaptiveController": ".adaptive",
+    "AdaptivePursuit": ".adaptive",
+    "run_decomposed_genetic_algorithm": ".decomposition",
+    "reoptimize": ".incremental",
+    "apply_city_diff": ".incremental",
+    "repair_route": ".incremental",
+    "warm_population": ".incremental",
+    "InstanceUpdate": ".incremental",
+    "get_distance_matrix": ".initialize",
+    "distances_between": ".initialize",
+    "find_next_city": ".initialize",
+    "nearest_neighbor": ".initialize",
+    "gen_population": ".initialize",
+    "validate_cities": ".initialize",
+    "open_routes": ".initialize",
+    "close_routes": ".initialize",
+    "swap_mutation": ".mutation",
+    "inversion_mutation": ".mutation",
+    "scramble_mutation": ".mutation",
+    "insert_mutation": ".mutation",
+    "displacement_mutation": ".mutation",
+    "two_opt_mutation": ".mutation",
+    "mutate_tour": ".mutation",
+    "order_crossover": ".crossover",
+    "partially_mapped_crossover": ".crossover",
+    "cycle_crossover": ".crossover",
+    "position_based_crossover": ".crossover",
+    "edge_recombination_crossover": ".crossover",
+    "edge_assembly_crossover": ".crossover",
+    "Params": ".parameters",
+    "generate_param_grid": ".parameters",
+    "calculate_fitness": ".selection",
+    "tournament_selection": ".selection",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES) + ["crossover", "mutation"]
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
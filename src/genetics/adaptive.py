@@ -0,0 +1,139 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+CROSSOVER_OPERATORS = ("ox", "pmx", "pbx", "erx", "eax")
+MUTATION_OPERATORS = (
+    "swap",
+    "inversion",
+    "scramble",
+    "insert",
+    "displacement",
+    "two_opt",
+)
+
+
+class AdaptivePursuit:
+    """
+    Adaptive pursuit operator selection (Thierens, 2005).
+
+    Each operator keeps a quality estimate, updated with the mean reward of the
+    offspring it produced. Selection probabilities are pushed towards p_max for the
+    current best operator and towards p_min for all others, so every operator keeps
+    being tried while the best one dominates.
+    """
+
+    def __init__(
+        self,
+        operators: Sequence[str],
+        p_min: float = None,
+        alpha: float = 0.3,
+        beta: float = 0.3,
+    ):
+        self.operators = list(operators)
+        k = len(self.operators)
+        self.p_min = p_min if p_min is not None else 0.2 / k
+        self.p_max = 1 - (k - 1) * self.p_min
+        self.alpha = alpha
+        self.beta = beta
+        self.quality = np.zeros(k)
+        self.probabilities = np.full(k, 1 / k)
+
+    def select(self, size: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Draws `size` operator indices in one call.
+        """
+        return rng.choice(len(self.operators), size=size, p=self.probabilities)
+
+    def update(self, choices: np.ndarray, rewards: np.ndarray):
+        """
+        Credits every operator used this generation with the mean reward of its offspring.
+        """
+        for op in np.unique(choices):
+            mean_reward = rewards[choices == op].mean()
+            self.quality[op] += self.alpha * (mean_reward - self.quality[op])
+
+        best = self.quality.argmax()
+        target = np.full(len(self.operators), self.p_min)
+        target[best] = self.p_max
+        self.probabilities += self.beta * (target - self.probabilities)
+        self.probabilities /= self.probabilities.sum()
+
+    def as_dict(self) -> Dict[str, float]:
+        return dict(zip(self.operators, self.probabilities.round(4).tolist()))
+
+
+class AdaptiveController:
+    """
+    In-run control of crossover/mutation operators and of the mutation rate.
+
+    Operators are chosen per offspring by adaptive pursuit and rewarded with the
+    relative fitness gain of their offspring. The mutation rate follows the 1/5th
+    success rule: it grows when more than `target_success` of the mutations improve
+    their tour and shrinks otherwise.
+
+    After a run, `trace` holds one entry per generation with the selection
+    probabilities and the mutation rate, so an adaptive run reports the settings
+    it converged to.
+    """
+
+    def __init__(
+        self,
+        crossover_operators: Sequence[str] = CROSSOVER_OPERATORS,
+        mutation_operators: Sequence[str] = MUTATION_OPERATORS,
+        mutation_rate: float = 0.05,
+        min_mutation_rate: float = 0.005,
+        max_mutation_rate: float = 0.5,
+        target_success: float = 0.2,
+        rate_step: float = 1.1,
+    ):
+        self.crossover = AdaptivePursuit(crossover_operators)
+        self.mutation = AdaptivePursuit(mutation_operators)
+        self.mutation_rate = mutation_rate
+        self.min_mutation_rate = min_mutation_rate
+        self.max_mutation_rate = max_mutation_rate
+        self.target_success = target_success
+        self.rate_step = rate_step
+        self.trace: List[Dict] = []
+
+    def update_mutation_rate(self, improved: np.ndarray):
+        """
+        Applies the 1/5th success rule to the mutation rate.
+        """
+        if len(improved) == 0:
+            return
+        if improved.mean() > self.target_success:
+            self.mutation_rate *= self.rate_step
+        else:
+            self.mutation_rate /= self.rate_step
+        self.mutation_rate = float(
+            np.clip(self.mutation_rate, self.min_mutation_rate, self.max_mutation_rate)
+        )
+
+    def record(self, generation: int, best_fitness: float):
+        self.trace.append(
+            {
+                "generation": generation,
+                "best_fitness": float(best_fitness),
+                "crossover": self.crossover.as_dict(),
+                "mutation": self.mutation.as_dict(),
+                "mutation_rate": round(self.mutation_rate, 4),
+            }
+        )
+
+    def summary(self) -> Dict:
+        """
+        Returns the final operator probabilities and mutation rate.
+        """
+        return {
+            "crossover": self.crossover.as_dict(),
+            "mutation": self.mutation.as_dict(),
+            "mutation_rate": round(self.mutation_rate, 4),
+        }
+
+
+def relative_gain(new_fitness: np.ndarray, old_fitness: np.ndarray) -> np.ndarray:
+    """
+    Returns the relative fitness improvement, clipped at zero.
+    """
+    return np.maximum(0.0, (new_fitness - old_fitness) / old_fitness)
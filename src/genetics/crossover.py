@@ -5,20 +5,20 @@ Created: 19/9/2024
 Version: 1
 """
 
-import random
 from typing import List, Tuple
 
 import numpy as np
 
 
 def order_crossover(
-    parent1: np.ndarray, parent2: np.ndarray
+    parent1: np.ndarray, parent2: np.ndarray, rng: np.random.Generator = None
 ) -> (np.ndarray, np.ndarray):
     """
     Performs Order Crossover (OX) between two parents to produce two offspring.
     """
+    rng = np.random.default_rng() if rng is None else rng
     size = len(parent1)
-    start, end = sorted(np.random.choice(range(1, size - 2), 2, replace=False))
+    start, end = sorted(rng.choice(size, 2, replace=False))
 
     def fill_remaining(p1, p2):
         current_pos = (end + 1) % size
@@ -33,12 +33,8 @@ def order_crossover(
                 offspring[current_pos] = gene
                 genes_set.add(gene)
 
-                current_pos += 1
-                if current_pos == size:
-                    current_pos = 1
+                current_pos = (current_pos + 1) % size
 
-        if offspring[0] == -1:
-            offspring[0] = offspring[-1]
         return offspring
 
     offspring1 = fill_remaining(parent2, parent1)
@@ -47,12 +43,13 @@ def order_crossover(
     return offspring1, offspring2
 
 
-def partially_mapped_crossover(parent1, parent2):
+def partially_mapped_crossover(parent1, parent2, rng: np.random.Generator = None):
     """
     Performs Partially Mapped Crossover (PMX) between two parents to produce two offspring.
     """
-    size = len(parent1) - 1
-    a, b = sorted(np.random.choice(range(size), 2, replace=False))
+    rng = np.random.default_rng() if rng is None else rng
+    size = len(parent1)
+    a, b = sorted(rng.choice(size, 2, replace=False))
 
     def pmx_create_child(p1, p2):
         child = [None] * size
@@ -67,7 +64,6 @@ def partially_mapped_crossover(parent1, parent2):
                     city = mapping[city]
                 child[i] = city
 
-        child.append(child[0])
         return child
 
     child1 = pmx_create_child(parent1, parent2)
@@ -76,11 +72,13 @@ def partially_mapped_crossover(parent1, parent2):
     return child1, child2
 
 
-def cycle_crossover(parent1, parent2):
+def cycle_crossover(parent1, parent2, rng: np.random.Generator = None):
     """
     Performs Cycle Crossover (CX) between two parents to produce two offspring.
+    CX is deterministic; rng is accepted for a uniform operator signature.
     """
-    size = len(parent1) - 1
+    parent1, parent2 = list(parent1), list(parent2)
+    size = len(parent1)
 
     def cx_create_child(p1, p2):
         child = [None] * size
@@ -94,7 +92,6 @@ def cycle_crossover(parent1, parent2):
                     if index == start:
                         break
             index = child.index(None) if None in child else size
-        child.append(child[0])
         return child
 
     child1 = cx_create_child(parent1, parent2)
@@ -103,7 +100,7 @@ def cycle_crossover(parent1, parent2):
     return child1, child2
 
 
-def position_based_crossover(parent1, parent2):
+def position_based_crossover(parent1, parent2, rng: np.random.Generator = None):
     """
     Performs Position-Based Crossover (PBX) between two parents to produce two offspring.
 
@@ -111,10 +108,9 @@ def position_based_crossover(parent1, parent2):
     positions in the child. The remaining positions are filled with the other parent's values in the order
     they appear, skipping over the already selected elements.
     """
-    size = (
-        len(parent1) - 1
-    )  # We exclude the last city as it repeats the first (circular TSP)
-    positions = sorted(np.random.choice(range(size), size // 2, replace=False))
+    rng = np.random.default_rng() if rng is None else rng
+    size = len(parent1)
+    positions = sorted(rng.choice(size, size // 2, replace=False))
 
     def pbx_create_child(p1, p2):
         child = [None] * size
@@ -130,7 +126,6 @@ def position_based_crossover(parent1, parent2):
                     current_idx += 1
                 child[current_idx] = city
 
-        child.append(child[0])  # Make it circular for the TSP
         return child
 
     child1 = pbx_create_child(parent1, parent2)
@@ -139,7 +134,230 @@ def position_based_crossover(parent1, parent2):
     return child1, child2
 
 
-def crossover(parent1, parent2, method="ox"):
+def tour_adjacency(route) -> np.ndarray:
+    """
+    Returns the (n, 2) adjacency array [predecessor, successor] of a tour.
+    """
+    tour = np.asarray(route)
+    adjacency = np.empty((len(tour), 2), dtype=int)
+    adjacency[tour, 0] = np.roll(tour, 1)
+    adjacency[tour, 1] = np.roll(tour, -1)
+    return adjacency
+
+
+def edge_recombination_crossover(parent1, parent2, rng: np.random.Generator = None):
+    """
+    Performs Edge Recombination Crossover (ERX) between two parents to produce two offspring.
+
+    The union of both parents' adjacency arrays forms an edge table. Starting from a
+    parent's first city, the child repeatedly moves to the unvisited neighbor that has
+    the fewest unvisited neighbors left (ties broken at random), and jumps to a random
+    unvisited city only when every neighbor is used. Most child edges are inherited.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    edge_table = np.hstack((tour_adjacency(parent1), tour_adjacency(parent2))).tolist()
+    size = len(edge_table)
+
+    def erx_create_child(start):
+        visited = [False] * size
+        remaining = rng.permutation(size).tolist()  # fallback order for dead ends
+        child = [start]
+        visited[start] = True
+
+        for _ in range(size - 1):
+            candidates = {c for c in edge_table[child[-1]] if not visited[c]}
+            if candidates:
+                degrees = {
+                    c: len({n for n in edge_table[c] if not visited[n]})
+                    for c in candidates
+                }
+                fewest = min(degrees.values())
+                best = [c for c in sorted(candidates) if degrees[c] == fewest]
+                city = best[rng.integers(len(best))]
+            else:
+                while visited[remaining[-1]]:
+                    remaining.pop()
+                city = remaining[-1]
+            child.append(city)
+            visited[city] = True
+
+        return np.array(child, dtype=int)
+
+    child1 = erx_create_child(int(parent1[0]))
+    child2 = erx_create_child(int(parent2[0]))
+
+    return child1, child2
+
+
+def _ab_cycles(adjacency_a, adjacency_b, rng: np.random.Generator):
+    """
+    Decomposes the edges that belong to exactly one parent into AB-cycles: closed
+    walks alternating between an edge of A and an edge of B.
+    Each cycle is returned as a vertex list [v0, v1, ..., v0] whose even-indexed
+    steps are A edges and odd-indexed steps are B edges.
+    """
+    size = len(adjacency_a)
+    edges_a = [set(row) for row in adjacency_a.tolist()]
+    edges_b = [set(row) for row in adjacency_b.tolist()]
+    for v in range(size):
+        common = edges_a[v] & edges_b[v]
+        edges_a[v] -= common
+        edges_b[v] -= common
+
+    cycles = []
+    starts = [v for v in rng.permutation(size).tolist() if edges_a[v]]
+    for start in starts:
+        if not edges_a[start]:
+            continue
+        path = [start]
+        even_position = {start: 0}
+
+        while True:
+            v = path[-1]
+            edges = edges_a if len(path) % 2 == 1 else edges_b
+            if not edges[v]:
+                break
+            options = sorted(edges[v])
+            u = options[rng.integers(len(options))]
+            edges[v].discard(u)
+            edges[u].discard(v)
+            path.append(u)
+
+            last = len(path) - 1
+            if last % 2 == 0 and u in even_position:
+                # The walk closed an alternating cycle: cut it off the path
+                first = even_position[u]
+                cycles.append(path[first:])
+                for w in path[first + 1 : -1]:
+                    if even_position.get(w, -1) > first:
+                        del even_position[w]
+                del path[first + 1 :]
+                if len(path) == 1 and not edges_a[path[0]]:
+                    break
+            elif last % 2 == 0:
+                even_position[u] = last
+
+    return cycles
+
+
+def _replace_neighbor(adjacency, v, old, new):
+    slot = 0 if adjacency[v, 0] == old else 1
+    adjacency[v, slot] = new
+
+
+def _components(adjacency) -> np.ndarray:
+    """
+    Labels the subtours of a 2-regular adjacency array.
+    """
+    size = len(adjacency)
+    labels = np.full(size, -1, dtype=int)
+    label = 0
+    for start in range(size):
+        if labels[start] != -1:
+            continue
+        previous, current = -1, start
+        while labels[current] == -1:
+            labels[current] = label
+            a, b = adjacency[current]
+            previous, current = current, (b if a == previous else a)
+        label += 1
+    return labels
+
+
+def _merge_subtours(adjacency, distance_matrix):
+    """
+    Greedily merges subtours into one tour: the smallest subtour is joined to another
+    by the cheapest exchange of one of its edges (u, u') and an outside edge (v, v')
+    for the edges (u, v) and (u', v'), as in the EAX repair step.
+    """
+    labels = _components(adjacency)
+    while labels.max() > 0:
+        smallest = np.bincount(labels).argmin()
+        inside = np.nonzero(labels == smallest)[0]
+        outside = np.nonzero(labels != smallest)[0]
+
+        best = None
+        for slot_u in (0, 1):
+            for slot_v in (0, 1):
+                u, u_next = inside, adjacency[inside, slot_u]
+                v, v_next = outside, adjacency[outside, slot_v]
+                delta = (
+                    distance_matrix[u[:, None], v[None, :]]
+                    + distance_matrix[u_next[:, None], v_next[None, :]]
+                    - distance_matrix[u, u_next][:, None]
+                    - distance_matrix[v, v_next][None, :]
+                )
+                i, j = np.unravel_index(delta.argmin(), delta.shape)
+                if best is None or delta[i, j] < best[0]:
+                    best = (delta[i, j], u[i], u_next[i], v[j], v_next[j])
+
+        _, a, a_next, b, b_next = best
+        _replace_neighbor(adjacency, a, a_next, b)
+        _replace_neighbor(adjacency, a_next, a, b_next)
+        _replace_neighbor(adjacency, b, b_next, a)
+        _replace_neighbor(adjacency, b_next, b, a_next)
+        labels = _components(adjacency)
+
+    return adjacency
+
+
+def edge_assembly_crossover(
+    parent1, parent2, rng: np.random.Generator = None, distance_matrix=None
+):
+    """
+    Performs Edge Assembly Crossover (EAX) between two parents to produce two offspring.
+
+    The edges found in only one parent are split into AB-cycles. A random AB-cycle is
+    applied to parent A (its A edges removed, its B edges added), which yields a set of
+    subtours that are merged back into one tour by cheapest 2-opt style exchanges.
+    Children keep almost all of their edges from the parents, which makes EAX converge
+    in far fewer generations than position-based operators on large instances.
+    Requires the distance matrix for the merge step.
+    """
+    if distance_matrix is None:
+        raise ValueError("EAX requires the distance matrix")
+    rng = np.random.default_rng() if rng is None else rng
+
+    def eax_create_child(p_a, p_b):
+        adjacency = tour_adjacency(p_a)
+        cycles = _ab_cycles(adjacency, tour_adjacency(p_b), rng)
+        if not cycles:
+            return np.array(p_a, dtype=int)
+
+        cycle = cycles[rng.integers(len(cycles))]
+        a_edges = [(cycle[k], cycle[k + 1]) for k in range(0, len(cycle) - 1, 2)]
+        b_edges = [(cycle[k], cycle[k + 1]) for k in range(1, len(cycle) - 1, 2)]
+        for x, y in a_edges:
+            _replace_neighbor(adjacency, x, y, -1)
+            _replace_neighbor(adjacency, y, x, -1)
+        for x, y in b_edges:
+            _replace_neighbor(adjacency, x, -1, y)
+            _replace_neighbor(adjacency, y, -1, x)
+
+        adjacency = _merge_subtours(adjacency, distance_matrix)
+
+        # Walk the single remaining tour from parent A's first city
+        child = [int(p_a[0])]
+        previous = -1
+        for _ in range(len(adjacency) - 1):
+            a, b = adjacency[child[-1]]
+            previous, current = child[-1], (b if a == previous else a)
+            child.append(current)
+        return np.array(child, dtype=int)
+
+    child1 = eax_create_child(parent1, parent2)
+    child2 = eax_create_child(parent2, parent1)
+
+    return child1, child2
+
+
+def crossover(
+    parent1,
+    parent2,
+    method="ox",
+    rng: np.random.Generator = None,
+    distance_matrix: np.ndarray = None,
+):
     """
     Performs crossover between two parent solutions using the specified crossover method.
 
@@ -157,6 +375,14 @@ def crossover(parent1, parent2, method="ox"):
             - 'pmx' : Partially Mapped Crossover (PMX)
             - 'cx' : Cycle Crossover (CX)
             - 'pbx' : Position-Based Crossover (PBX)
+            - 'erx' : Edge Recombination Crossover (ERX)
+            - 'eax' : Edge Assembly Crossover (EAX)
+
+    rng : np.random.Generator, optional
+        Random number generator of the run. A fresh unseeded one is used if omitted.
+
+    distance_matrix : np.ndarray, optional
+        Distance matrix of the instance, required by 'eax'.
 
     Returns:
     --------
@@ -165,12 +391,16 @@ def crossover(parent1, parent2, method="ox"):
     """
 
     if method == "ox":
-        return order_crossover(parent1, parent2)
+        return order_crossover(parent1, parent2, rng)
     elif method == "pmx":
-        return partially_mapped_crossover(parent1, parent2)
+        return partially_mapped_crossover(parent1, parent2, rng)
     elif method == "cx":
-        return cycle_crossover(parent1, parent2)
+        return cycle_crossover(parent1, parent2, rng)
     elif method == "pbx":
-        return position_based_crossover(parent1, parent2)
+        return position_based_crossover(parent1, parent2, rng)
+    elif method == "erx":
+        return edge_recombination_crossover(parent1, parent2, rng)
+    elif method == "eax":
+        return edge_assembly_crossover(parent1, parent2, rng, distance_matrix)
     else:
         raise ValueError("Invalid crossover method")
@@ -0,0 +1,211 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List
+
+import numpy as np
+
+from genetics.exact import two_opt
+from genetics.genetics import run_genetic_algorithm
+from genetics.initialize import distances_between, nearest_neighbor, validate_cities
+from genetics.parameters import Params
+
+
+def grid_clusters(coords: np.ndarray, cluster_size: int) -> List[np.ndarray]:
+    """
+    Splits the cities into balanced grid cells: vertical strips of equal count,
+    each cut along Y into chunks of about cluster_size cities.
+    """
+    num_clusters = math.ceil(len(coords) / cluster_size)
+    num_strips = math.ceil(math.sqrt(num_clusters))
+
+    clusters = []
+    by_x = np.argsort(coords[:, 0], kind="stable")
+    for strip in np.array_split(by_x, num_strips):
+        by_y = strip[np.argsort(coords[strip, 1], kind="stable")]
+        num_cells = max(1, round(len(strip) / cluster_size))
+        clusters.extend(np.array_split(by_y, num_cells))
+
+    return [cluster for cluster in clusters if len(cluster)]
+
+
+def kmeans_clusters(
+    coords: np.ndarray,
+    cluster_size: int,
+    iterations: int = 20,
+    chunk_size: int = 4096,
+    rng: np.random.Generator = None,
+) -> List[np.ndarray]:
+    """
+    Splits the cities with Lloyd's k-means, k = ceil(n / cluster_size).
+    Assignments are computed in row chunks to bound memory on large instances.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    coords = coords.astype(np.float64)
+    k = math.ceil(len(coords) / cluster_size)
+    centroids = coords[rng.choice(len(coords), k, replace=False)]
+    labels = np.zeros(len(coords), dtype=int)
+
+    for _ in range(iterations):
+        for start in range(0, len(coords), chunk_size):
+            block = coords[start : start + chunk_size]
+            sq_dists = ((block[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=2)
+            labels[start : start + chunk_size] = sq_dists.argmin(axis=1)
+
+        counts = np.bincount(labels, minlength=k)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, coords)
+        non_empty = counts > 0
+        centroids[non_empty] = sums[non_empty] / counts[non_empty, None]
+
+    return [np.nonzero(labels == c)[0] for c in range(k) if np.any(labels == c)]
+
+
+def _solve_cluster(
+    sub_cities: np.ndarray,
+    params: Params,
+    solver: Callable,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """
+    Solves one cluster and returns an open tour of local indices.
+    """
+    if len(sub_cities) <= 3:
+        return np.arange(len(sub_cities))
+    best_route, _, _, _ = solver(sub_cities, params, rng=rng)
+    return np.asarray(best_route)[:-1]
+
+
+def _order_clusters(centroids: np.ndarray) -> np.ndarray:
+    """
+    Finds a short tour through the cluster centroids (nearest neighbor + 2-opt).
+    """
+    if len(centroids) <= 3:
+        return np.arange(len(centroids))
+    dists = np.sqrt(((centroids[:, None] - centroids[None, :]) ** 2).sum(axis=2))
+    route = nearest_neighbor(0, dists, len(centroids))
+    return two_opt(route, dists)[:-1]
+
+
+def _stitch(
+    sub_tours: List[np.ndarray], order: np.ndarray, coords: np.ndarray
+) -> np.ndarray:
+    """
+    Concatenates the cluster sub-tours in cluster order. Each sub-tour is rotated
+    to enter at the city closest to the previous exit, and oriented so that its
+    exit is closest to the next cluster's centroid.
+    """
+    centroids = [coords[sub_tours[c]].mean(axis=0) for c in order]
+    tour = []
+    prev_exit = centroids[-1]
+
+    for position, c in enumerate(order):
+        sub_tour = sub_tours[c]
+        next_centroid = centroids[(position + 1) % len(order)]
+
+        entry = np.argmin(((coords[sub_tour] - prev_exit) ** 2).sum(axis=1))
+        forward = np.roll(sub_tour, -entry)
+        backward = np.roll(forward[::-1], 1)
+        if np.sum((coords[backward[-1]] - next_centroid) ** 2) < np.sum(
+            (coords[forward[-1]] - next_centroid) ** 2
+        ):
+            forward = backward
+
+        tour.append(forward)
+        prev_exit = coords[forward[-1]]
+
+    return np.concatenate(tour)
+
+
+def repair_seams(
+    tour: np.ndarray, seams: np.ndarray, coords: np.ndarray, window: int
+) -> np.ndarray:
+    """
+    Runs 2-opt on the path of `window` cities on each side of every seam,
+    keeping the path endpoints fixed so the rest of the tour is untouched.
+    """
+    tour = tour.copy()
+    for seam in seams:
+        start, end = max(0, seam - window), min(len(tour), seam + window + 1)
+        path = tour[start:end]
+        if len(path) < 4:
+            continue
+        local = distances_between(coords[path], coords[path])
+        order = two_opt(np.arange(len(path)), local)
+        tour[start:end] = path[order]
+    return tour
+
+
+def run_decomposed_genetic_algorithm(
+    cities: np.ndarray,
+    params: Params,
+    cluster_size: int = 200,
+    n_workers: int = None,
+    method: str = "grid",
+    seam_window: int = 25,
+    solver: Callable = run_genetic_algorithm,
+    rng: np.random.Generator = None,
+):
+    """
+    Divide-and-conquer solver for very large instances.
+
+    The cities are clustered ('grid' or 'kmeans' on the coordinate columns), each
+    cluster is solved with `solver` in a separate process, the sub-tours are
+    stitched along a tour of the cluster centroids, and the seams between clusters
+    are repaired with localized 2-opt. The full distance matrix is never built.
+
+    Parameters:
+    - cluster_size (int): Target number of cities per cluster.
+    - n_workers (int): Number of worker processes, default is os.cpu_count().
+    - method (str): Clustering method, 'grid' or 'kmeans'.
+    - seam_window (int): Number of cities on each side of a seam to re-optimise.
+    - solver (Callable): Function solving a cluster, default is run_genetic_algorithm.
+    - rng (np.random.Generator): Parent generator; each cluster gets an independent child stream.
+
+    Returns the same (best_route, best_fitness, best_fitness_history, best_route_history)
+    tuple as run_genetic_algorithm.
+    """
+    validate_cities(cities)
+    rng = np.random.default_rng() if rng is None else rng
+    coords = cities[:, 1:3]
+
+    if method == "grid":
+        clusters = grid_clusters(coords, cluster_size)
+    elif method == "kmeans":
+        clusters = kmeans_clusters(coords, cluster_size, rng=rng)
+    else:
+        raise ValueError("Invalid clustering method")
+
+    sub_instances = []
+    for cluster in clusters:
+        sub_cities = cities[cluster].copy()
+        sub_cities[:, 0] = np.arange(len(cluster))
+        sub_instances.append(sub_cities)
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        local_tours = list(
+            executor.map(
+                _solve_cluster,
+                sub_instances,
+                [params] * len(clusters),
+                [solver] * len(clusters),
+                rng.spawn(len(clusters)),
+            )
+        )
+    sub_tours = [cluster[tour] for cluster, tour in zip(clusters, local_tours)]
+
+    centroids = np.array([coords[cluster].mean(axis=0) for cluster in clusters])
+    order = _order_clusters(centroids)
+    tour = _stitch(sub_tours, order, coords)
+
+    # Rotate so that the closing seam is not split by the array boundary
+    shift = min(seam_window, len(tour) - 1)
+    tour = np.roll(tour, shift)
+    seams = np.cumsum([shift] + [len(sub_tours[c]) for c in order[:-1]])
+    tour = repair_seams(tour, seams, coords, seam_window)
+
+    best_route = np.append(tour, tour[0])
+    edges = coords[best_route[1:]] - coords[best_route[:-1]]
+    total_distance = np.sqrt((edges**2).sum(axis=1)).astype(int).sum()
+    best_fitness = 1.0 / total_distance if total_distance > 0 else float("inf")
+
+    return best_route, best_fitness, [best_fitness], [best_route]
@@ -0,0 +1,169 @@
+import numpy as np
+
+from genetics.initialize import nearest_neighbor
+
+
+def route_length(route: np.ndarray, distance_matrix: np.ndarray) -> int:
+    """
+    Computes the total length of a closed route (first city repeated at the end).
+    """
+    return distance_matrix[route[:-1], route[1:]].sum()
+
+
+def held_karp(distance_matrix: np.ndarray) -> np.ndarray:
+    """
+    Solves the TSP exactly with the Held-Karp dynamic programming algorithm.
+
+    City 0 is the fixed start; dp[mask, k] holds the length of the shortest path
+    that starts at city 0, visits every city of `mask` (bit k-1 <=> city k) and
+    ends at city k. Memory and time grow as 2^n, so this is only meant for tiny
+    instances (n <= ~15).
+    """
+    num_cities = distance_matrix.shape[0]
+    if num_cities <= 3:
+        return np.append(np.arange(num_cities), 0)
+
+    m = num_cities - 1
+    inner = distance_matrix[1:, 1:].astype(np.float64)
+    num_masks = 1 << m
+
+    dp = np.full((num_masks, m), np.inf)
+    parent = np.full((num_masks, m), -1, dtype=np.int64)
+    bits = 1 << np.arange(m)
+    dp[bits, np.arange(m)] = distance_matrix[0, 1:]
+
+    for mask in range(1, num_masks):
+        # Best way to reach every k from any end city j already in the mask
+        costs = dp[mask][:, None] + inner
+        best_j = costs.argmin(axis=0)
+        best_cost = costs[best_j, np.arange(m)]
+
+        outside = (mask & bits) == 0
+        targets = mask | bits[outside]
+        ks = np.nonzero(outside)[0]
+        improved = best_cost[ks] < dp[targets, ks]
+        dp[targets[improved], ks[improved]] = best_cost[ks][improved]
+        parent[targets[improved], ks[improved]] = best_j[ks][improved]
+
+    full = num_masks - 1
+    last = int(np.argmin(dp[full] + distance_matrix[1:, 0]))
+
+    # Walk the parent pointers back to city 0
+    route = [0]
+    mask = full
+    while last != -1:
+        route.append(last + 1)
+        previous = parent[mask, last]
+        mask ^= 1 << last
+        last = previous
+    route.append(0)
+
+    return np.array(route[::-1], dtype=int)
+
+
+def two_opt(route: np.ndarray, distance_matrix: np.ndarray) -> np.ndarray:
+    """
+    Applies best-improvement 2-opt moves until the route is 2-optimal.
+    The whole delta matrix is evaluated at once for every pass.
+    """
+    route = route.copy()
+    n = len(route) - 1
+    valid = np.triu(np.ones((n, n), dtype=bool), k=2)
+
+    while True:
+        a, b = route[:-1], route[1:]
+        delta = (
+            distance_matrix[a[:, None], a[None, :]]
+            + distance_matrix[b[:, None], b[None, :]]
+            - distance_matrix[a, b][:, None]
+            - distance_matrix[a, b][None, :]
+        )
+        delta = np.where(valid, delta, 0)
+        i, j = np.unravel_index(delta.argmin(), delta.shape)
+        if delta[i, j] >= 0:
+            return route
+        route[i + 1 : j + 1] = route[i + 1 : j + 1][::-1]
+
+
+def or_opt(
+    route: np.ndarray, distance_matrix: np.ndarray, max_segment: int = 3
+) -> np.ndarray:
+    """
+    Applies first-improvement Or-opt moves: segments of 1 to `max_segment` cities
+    are moved (optionally reversed) to the cheapest position elsewhere in the route.
+    """
+    tour = route[:-1].copy()
+    n = len(tour)
+    improved = True
+
+    while improved:
+        improved = False
+        for length in range(1, min(max_segment, n - 2) + 1):
+            for start in range(n - length + 1):
+                segment = tour[start : start + length]
+                prev, nxt = tour[start - 1], tour[(start + length) % n]
+                first, last = segment[0], segment[-1]
+                removal_gain = (
+                    distance_matrix[prev, first]
+                    + distance_matrix[last, nxt]
+                    - distance_matrix[prev, nxt]
+                )
+
+                rest = np.concatenate((tour[:start], tour[start + length :]))
+                left, right = rest, np.roll(rest, -1)
+                base = distance_matrix[left, right]
+                forward = (
+                    distance_matrix[left, first] + distance_matrix[last, right] - base
+                )
+                backward = (
+                    distance_matrix[left, last] + distance_matrix[first, right] - base
+                )
+
+                k_fwd, k_bwd = forward.argmin(), backward.argmin()
+                if forward[k_fwd] <= backward[k_bwd]:
+                    k, cost, insert = k_fwd, forward[k_fwd], segment
+                else:
+                    k, cost, insert = k_bwd, backward[k_bwd], segment[::-1]
+
+                if cost - removal_gain < 0:
+                    tour = np.concatenate((rest[: k + 1], insert, rest[k + 1 :]))
+                    improved = True
+                    break
+            if improved:
+                break
+
+    return np.append(tour, tour[0])
+
+
+def local_search(route: np.ndarray, distance_matrix: np.ndarray) -> np.ndarray:
+    """
+    Alternates 2-opt and Or-opt until neither finds an improving move.
+    """
+    best_length = route_length(route, distance_matrix)
+    while True:
+        route = or_opt(two_opt(route, distance_matrix), distance_matrix)
+        length = route_length(route, distance_matrix)
+        if length >= best_length:
+            return route
+        best_length = length
+
+
+def nearest_neighbor_local_search(
+    distance_matrix: np.ndarray, num_seeds: int = 10
+) -> np.ndarray:
+    """
+    Runs 2-opt/Or-opt local search from several nearest neighbor seeds and
+    returns the shortest resulting route.
+    """
+    num_cities = distance_matrix.shape[0]
+    seeds = np.linspace(0, num_cities - 1, min(num_seeds, num_cities), dtype=int)
+
+    best_route, best_length = None, np.inf
+    for first_city in np.unique(seeds):
+        route = nearest_neighbor(first_city, distance_matrix, num_cities)
+        route = local_search(route, distance_matrix)
+        length = route_length(route, distance_matrix)
+        if length < best_length:
+            best_route, best_length = route, length
+
+    return best_route
@@ -1,19 +1,34 @@
+import logging
+from typing import Callable
+
 import numpy as np
 
+from genetics.adaptive import AdaptiveController, relative_gain
 from genetics.initialize import (
+    close_routes,
     gen_population,
     get_distance_matrix,
+    open_routes,
     validate_cities,
 )
 from genetics.crossover import crossover
-from genetics.mutation import mutation
+from genetics.mutation import mutate_tour, mutation
+from genetics.parallel import ChunkedExecutor
 from genetics.selection import tournament_selection, calculate_fitness
+from genetics.solutions import SolutionStore
 from genetics.parameters import Params
 
 
 def evolve_population(
-    population: np.ndarray, fitness_scores: np.ndarray, params: Params
+    population: np.ndarray,
+    fitness_scores: np.ndarray,
+    params: Params,
+    rng: np.random.Generator = None,
+    distance_matrix: np.ndarray = None,
+    controller: AdaptiveController = None,
 ):
+    rng = np.random.default_rng() if rng is None else rng
+
     # Step 1: Elitism - retain the top elite_size individuals
     elite_indices = fitness_scores.argsort()[-params.elite_size :][::-1]
     elite = population[elite_indices]
@@ -21,61 +36,212 @@ def evolve_population(
     # Step 2: Selection - select parents using tournament selection
     num_parents = len(population) - params.elite_size
     parents = tournament_selection(
-        population, fitness_scores, params.tournament_size, num_parents
+        population, fitness_scores, params.tournament_size, num_parents, rng
     )
 
     # Step 3: Crossover - generate offspring from selected parents
+    num_pairs = (num_parents + 1) // 2
+    if controller is None:
+        crossover_types = [params.crossover_type] * num_pairs
+    else:
+        crossover_choices = controller.crossover.select(num_pairs, rng)
+        crossover_types = [controller.crossover.operators[c] for c in crossover_choices]
+
     offspring = np.empty((num_parents, len(parents[0])), dtype=int)
     for i in range(0, num_parents, 2):
         parent1 = parents[i]
         parent2 = parents[i + 1] if i + 1 < num_parents else parents[0]
-        child1, child2 = crossover(parent1, parent2, params.crossover_type)
+        child1, child2 = crossover(
+            parent1, parent2, crossover_types[i // 2], rng, distance_matrix
+        )
         offspring[i] = child1
         if i + 1 < num_parents:
             offspring[i + 1] = child2
 
     # Step 4: Mutation - mutate offspring
-    mutated_offspring = mutation(offspring, params.mutation_rate)
+    if controller is None:
+        mutated_offspring = mutation(
+            offspring, params.mutation_rate, params.mutation_type, rng
+        )
+    else:
+        mutated_offspring = adapt_offspring(
+            parents, offspring, crossover_choices, controller, rng, distance_matrix
+        )
 
     # Step 5: Create new population by combining elites and mutated offspring
     new_population = np.vstack((elite, mutated_offspring))
     return new_population
 
 
-def run_genetic_algorithm(cities: np.ndarray, params: Params):
+def adapt_offspring(
+    parents: np.ndarray,
+    offspring: np.ndarray,
+    crossover_choices: np.ndarray,
+    controller: AdaptiveController,
+    rng: np.random.Generator,
+    distance_matrix: np.ndarray,
+) -> np.ndarray:
+    """
+    Credits the crossover operators with the gain of each child pair over its parents,
+    then mutates the offspring with operators and a rate chosen by the controller and
+    credits the mutation operators with the gain of each mutated tour.
+    """
+    if distance_matrix is None:
+        raise ValueError("Adaptive control requires the distance matrix")
+
+    pair_starts = np.arange(0, len(offspring), 2)
+    parent_fitness = calculate_fitness(parents, distance_matrix)
+    child_fitness = calculate_fitness(offspring, distance_matrix)
+    controller.crossover.update(
+        crossover_choices,
+        relative_gain(
+            np.maximum.reduceat(child_fitness, pair_starts),
+            np.maximum.reduceat(parent_fitness, pair_starts),
+        ),
+    )
+
+    mutated = np.nonzero(rng.random(len(offspring)) < controller.mutation_rate)[0]
+    if len(mutated) == 0:
+        return offspring
+
+    mutation_choices = controller.mutation.select(len(mutated), rng)
+    for idx, choice in zip(mutated, mutation_choices):
+        offspring[idx] = mutate_tour(
+            offspring[idx], controller.mutation.operators[choice], rng
+        )
+
+    mutated_fitness = calculate_fitness(offspring[mutated], distance_matrix)
+    controller.mutation.update(
+        mutation_choices, relative_gain(mutated_fitness, child_fitness[mutated])
+    )
+    controller.update_mutation_rate(mutated_fitness > child_fitness[mutated])
+    return offspring
+
+
+def run_genetic_algorithm(
+    cities: np.ndarray,
+    params: Params,
+    rng: np.random.Generator = None,
+    controller: AdaptiveController = None,
+    distance_matrix: np.ndarray = None,
+    initial_routes: np.ndarray = None,
+    callback: Callable = None,
+    executor: ChunkedExecutor = None,
+    solutions: SolutionStore = None,
+):
+    """
+    Runs the genetic algorithm on the given cities.
+
+    distance_matrix skips recomputing the matrix when the caller already has it, and
+    initial_routes (closed or open routes) replace the first rows of the initial
+    population to warm-start the run from known tours. callback, if given, is called
+    as callback(generation, population, fitness_scores) once per generation.
+
+    With params.threads > 1 (or an explicit executor), fitness evaluation and breeding
+    run in row blocks of params.chunk_size tours on a thread pool. Only the fitness
+    evaluation gets faster, for populations of several thousand tours; breeding holds
+    the GIL in its crossover loop (see ChunkedExecutor). The adaptive controller only
+    uses the chunked fitness evaluation.
+
+    With a SolutionStore as solutions, the best tours stored for the same instance are
+    added to initial_routes, and the best route of the run is stored afterwards, so
+    repeated solves start near the previous best.
+
+    Internally every route is an open permutation of the N cities and the return to
+    the first city is implicit; the returned best route and route history are closed
+    (first city repeated at the end).
+    """
+    # Every random draw of the run comes from this generator, so concurrent runs
+    # with independent generators never share state and are reproducible.
+    rng = np.random.default_rng() if rng is None else rng
+
+    # With params.adaptive, operators and mutation rate are tuned during the run;
+    # pass a controller explicitly to read its trace afterwards.
+    if controller is None and params.adaptive:
+        controller = AdaptiveController(mutation_rate=params.mutation_rate)
+
     # Step 1: Validate city data
     validate_cities(cities)
 
     # Step 2: Generate distance matrix
-    distance_matrix = get_distance_matrix(cities)
+    if distance_matrix is None:
+        distance_matrix = get_distance_matrix(cities)
     # print("Distance matrix generated.")
 
     # Step 3: Generate initial population
-    population = gen_population(
-        params.initial_population, params.population_size, distance_matrix
-    )
+    if solutions is not None:
+        known = open_routes(solutions.best(cities))
+        if initial_routes is not None and len(initial_routes):
+            initial_routes = np.vstack((open_routes(initial_routes), known))
+        elif len(known):
+            initial_routes = known
+    seeds = np.empty((0, len(cities)), dtype=int)
+    if initial_routes is not None and len(initial_routes):
+        seeds = open_routes(initial_routes)[: params.population_size]
+    # Only the rows not taken by seeds are generated (nearest-neighbor tours are slow)
+    population = np.vstack(
+        (
+            seeds,
+            gen_population(
+                params.initial_population,
+                params.population_size - len(seeds),
+                distance_matrix,
+                rng,
+            ),
+        )
+    ).astype(int)
 
     # Initialize variables to track progress
     best_fitness_history = []
     best_route_history = []
 
-    for generation in range(params.generations):
-        # Step 4: Calculate fitness scores
-        fitness_scores = calculate_fitness(population, distance_matrix)
-
-        # Record the best fitness and route
-        best_fitness = fitness_scores.max()
-        best_index = fitness_scores.argmax()
-        best_fitness_history.append(best_fitness)
-        best_route_history.append(population[best_index])
-
-        # Step 5: Evolve population
-        population = evolve_population(population, fitness_scores, params)
-
-    # After all generations, find the best route
-    final_fitness_scores = calculate_fitness(population, distance_matrix)
+    owns_executor = executor is None and params.threads > 1
+    if owns_executor:
+        executor = ChunkedExecutor(params.threads, params.chunk_size)
+    if executor is None:
+        evaluate = calculate_fitness
+    else:
+        evaluate = executor.calculate_fitness
+
+    # The pool of an executor created here is shut down even if a step or the
+    # callback raises
+    try:
+        for generation in range(params.generations):
+            # Step 4: Calculate fitness scores
+            fitness_scores = evaluate(population, distance_matrix)
+
+            # Record the best fitness and route
+            best_fitness = fitness_scores.max()
+            best_index = fitness_scores.argmax()
+            best_fitness_history.append(best_fitness)
+            best_route_history.append(close_routes(population[best_index]))
+            if controller is not None:
+                controller.record(generation, best_fitness)
+            if callback is not None:
+                callback(generation, population, fitness_scores)
+
+            # Step 5: Evolve population
+            if executor is not None and controller is None:
+                population = executor.evolve_population(
+                    population, fitness_scores, params, rng, distance_matrix
+                )
+            else:
+                population = evolve_population(
+                    population, fitness_scores, params, rng, distance_matrix, controller
+                )
+
+        # After all generations, find the best route
+        final_fitness_scores = evaluate(population, distance_matrix)
+    finally:
+        if owns_executor:
+            executor.shutdown()
     best_index = final_fitness_scores.argmax()
-    best_route = population[best_index]
+    best_route = close_routes(population[best_index])
     best_fitness = final_fitness_scores[best_index]
+    if solutions is not None:
+        solutions.add(cities, best_route)
+
+    if controller is not None:
+        logging.info(f"Adaptive controller: {controller.summary()}")
 
     return best_route, best_fitness, best_fitness_history, best_route_history
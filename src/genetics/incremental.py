@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+from genetics.genetics import run_genetic_algorithm
+from genetics.initialize import distances_between, open_routes
+from genetics.mutation import inversion_mutation
+from genetics.parameters import Params
+
+
+@dataclass
+class InstanceUpdate:
+    cities: np.ndarray  # updated instance, city IDs renumbered 0..m-1
+    distance_matrix: np.ndarray
+    old_to_new: np.ndarray  # new index of every previous city, -1 if removed
+    added: np.ndarray  # new indices of the added cities
+
+
+def apply_city_diff(
+    cities: np.ndarray,
+    distance_matrix: np.ndarray,
+    removed_ids: Sequence[int] = (),
+    added_coords: np.ndarray = None,
+) -> InstanceUpdate:
+    """
+    Applies a diff of removed city IDs and added coordinates to an instance.
+
+    Kept cities keep their relative order and are renumbered; added cities are
+    appended. The distance matrix is not rebuilt: rows and columns of kept cities are
+    sliced from the previous matrix and only the rows and columns of the added cities
+    are computed.
+    """
+    num_cities = len(cities)
+    keep = np.ones(num_cities, dtype=bool)
+    keep[np.asarray(removed_ids, dtype=int)] = False
+    kept = np.nonzero(keep)[0]
+
+    old_to_new = np.full(num_cities, -1, dtype=int)
+    old_to_new[kept] = np.arange(len(kept))
+
+    added_coords = (
+        np.empty((0, cities.shape[1] - 1), dtype=cities.dtype)
+        if added_coords is None
+        else np.asarray(added_coords, dtype=cities.dtype).reshape(len(added_coords), -1)
+    )
+    coords = np.vstack((cities[kept, 1:], added_coords))
+    new_cities = np.column_stack((np.arange(len(coords)), coords)).astype(cities.dtype)
+    added = np.arange(len(kept), len(coords))
+
+    new_matrix = np.empty((len(coords), len(coords)), dtype=distance_matrix.dtype)
+    new_matrix[: len(kept), : len(kept)] = distance_matrix[np.ix_(kept, kept)]
+    if len(added):
+        added_rows = distances_between(coords[added], coords)
+        new_matrix[added, :] = added_rows
+        new_matrix[:, added] = added_rows.T
+
+    return InstanceUpdate(new_cities, new_matrix, old_to_new, added)
+
+
+def repair_route(
+    route: np.ndarray, update: InstanceUpdate, distance_matrix: np.ndarray
+) -> np.ndarray:
+    """
+    Maps a closed route of the previous instance onto the updated one: removed cities
+    are dropped (their neighbors are joined) and every added city is inserted at its
+    cheapest position.
+    """
+    tour = update.old_to_new[np.asarray(route)[:-1]]
+    tour = tour[tour >= 0]
+
+    for city in update.added:
+        if len(tour) < 2:
+            tour = np.append(tour, city)
+            continue
+        nxt = np.roll(tour, -1)
+        cost = (
+            distance_matrix[tour, city]
+            + distance_matrix[city, nxt]
+            - distance_matrix[tour, nxt]
+        )
+        tour = np.insert(tour, cost.argmin() + 1, city)
+
+    return np.append(tour, tour[0])
+
+
+def warm_population(
+    seeds: np.ndarray, population_size: int, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Fills a population from closed seed routes: the seeds themselves, then copies of
+    them with one random segment reversal each (a 2-opt move, so only two edges
+    change). Cheap even on large instances, unlike nearest-neighbor tours.
+    """
+    seeds = open_routes(np.atleast_2d(seeds))[:population_size]
+    population = seeds[np.arange(population_size) % len(seeds)].copy()
+    for i in range(len(seeds), population_size):
+        population[i] = inversion_mutation(population[i], rng)
+    return population
+
+
+def reoptimize(
+    cities: np.ndarray,
+    distance_matrix: np.ndarray,
+    previous_routes: np.ndarray,
+    params: Params,
+    removed_ids: Sequence[int] = (),
+    added_coords: np.ndarray = None,
+    rng: np.random.Generator = None,
+):
+    """
+    Warm-starts the genetic algorithm after a small change of the city set.
+
+    The previous best routes are repaired by cheapest removal/insertion and the initial
+    population is filled with them and perturbed copies of them (see warm_population),
+    so no tour is built from scratch; the distance matrix is updated incrementally.
+    Since the run starts near the previous optimum, params.generations can usually be
+    much lower than for a cold start.
+
+    Returns the InstanceUpdate (new cities and distance matrix, needed for the next
+    diff) and the run_genetic_algorithm result tuple on the updated instance.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    update = apply_city_diff(cities, distance_matrix, removed_ids, added_coords)
+    seeds = np.array(
+        [
+            repair_route(route, update, update.distance_matrix)
+            for route in np.atleast_2d(previous_routes)
+        ]
+    )
+    result = run_genetic_algorithm(
+        update.cities,
+        params,
+        rng,
+        distance_matrix=update.distance_matrix,
+        initial_routes=warm_population(seeds, params.population_size, rng),
+    )
+    return update, result
@@ -5,14 +5,8 @@ def get_distance_matrix(cities):
     """
     Computes the Euclidean distance matrix for the given cities.
     """
-    num_of_cities = cities.shape[0]
-    dists = np.zeros((num_of_cities, num_of_cities), dtype=int)
-
-    for i in range(num_of_cities):
-        for j in range(num_of_cities):
-            dists[i, j] = np.linalg.norm(cities[j, 1:] - cities[i, 1:])
-
-    return dists
+    coords = cities[:, 1:]
+    return distances_between(coords, coords)
 
 
 def find_next_city(
@@ -63,27 +57,51 @@ def nearest_neighbor(first_city: int, dists: np.ndarray, num_cities: int) -> np.
     return route
 
 
-def gen_population(mode: str, population_size: int, cities: np.ndarray) -> np.ndarray:
+def gen_population(
+    mode: str,
+    population_size: int,
+    cities: np.ndarray,
+    rng: np.random.Generator = None,
+) -> np.ndarray:
     """
     Generates the initial population of routes.
-    Each route is a random permutation of city indices forming a cycle.
-    and the first one is generated using the nearest neighbor heuristic.
+    Each route is a random permutation of city indices forming a cycle,
+    and in "nn" mode some are generated using the nearest neighbor heuristic.
+    Routes are open: the return to the first city is implicit.
     """
+    rng = np.random.default_rng() if rng is None else rng
     num_cities = cities.shape[0]  # Number of cities
-    population = np.empty((population_size, num_cities + 1), dtype=int)
+    population = np.empty((population_size, num_cities), dtype=int)
 
     for i in range(population_size):
         if mode == "nn" and i % 2 and i < num_cities / 2:
-            population[i] = nearest_neighbor(i, cities, num_cities)
+            population[i] = nearest_neighbor(i, cities, num_cities)[:-1]
         else:
-            route = np.random.permutation(num_cities)
-            population[i, :-1] = route
-            population[i, -1] = route[0]
+            population[i] = rng.permutation(num_cities)
 
-    np.random.shuffle(population)
+    rng.shuffle(population)
     return population
 
 
+def open_routes(routes: np.ndarray) -> np.ndarray:
+    """
+    Drops the closing city of closed routes (first city repeated at the end).
+    Open routes are returned unchanged.
+    """
+    routes = np.asarray(routes)
+    if routes.shape[-1] > 1 and np.all(routes[..., 0] == routes[..., -1]):
+        return routes[..., :-1]
+    return routes
+
+
+def close_routes(routes: np.ndarray) -> np.ndarray:
+    """
+    Appends the first city to open routes, giving the closed routes of the public API.
+    """
+    routes = np.asarray(routes)
+    return np.concatenate((routes, routes[..., :1]), axis=-1)
+
+
 def validate_cities(cities_array):
     """
     Validates that each city has a unique ID within the correct range.
@@ -98,3 +116,12 @@ def validate_cities(cities_array):
     # Check that IDs are within 0 to num_cities - 1
     if city_ids.min() < 0 or city_ids.max() >= num_cities:
         raise ValueError("City IDs are out of the valid range.")
+
+
+def distances_between(coords_a: np.ndarray, coords_b: np.ndarray) -> np.ndarray:
+    """
+    Computes the Euclidean distances between two sets of coordinates,
+    truncated to int like get_distance_matrix.
+    """
+    diff = coords_a[:, None, :] - coords_b[None, :, :]
+    return np.sqrt((diff**2).sum(axis=2)).astype(int)
@@ -1,5 +1,4 @@
 import numpy as np
-import random
 
 """
 ### Mutation Functions for TSP Genetic Algorithm
@@ -12,62 +11,86 @@ This block contains various mutation functions used in the Genetic Algorithm (GA
 4. **insert_mutation**: Moves a city from one position to another within the tour.
 5. **displacement_mutation**: Removes a segment of the tour and reinserts it at a different position.
 6. **two_opt_mutation**: Reverses a segment of the tour to optimize local paths.
-Each function takes a NumPy array representing a tour and returns the mutated tour.
+Each function takes a NumPy array representing a tour and the run's np.random.Generator, and returns the mutated tour.
 """
 
 
-def swap_mutation(route, mutation_rate=0.01):
+def swap_mutation(route, mutation_rate=0.01, rng: np.random.Generator = None):
     """
     Performs swap mutation on a route with a given mutation rate.
+    All per-gene draws are made in bulk, then applied in order.
     """
-    for i in range(1, len(route) - 1):
-        if np.random.rand() < mutation_rate:
-            j = np.random.randint(1, len(route) - 1)
-            # Swap cities
-            route[i], route[j] = route[j], route[i]
+    rng = np.random.default_rng() if rng is None else rng
+    hits = np.nonzero(rng.random(len(route)) < mutation_rate)[0]
+    partners = rng.integers(len(route), size=len(hits))
+    for i, j in zip(hits, partners):
+        # Swap cities
+        route[i], route[j] = route[j], route[i]
     return route
 
 
-def inversion_mutation(tour: np.ndarray) -> np.ndarray:
-    i, j = sorted(random.sample(range(len(tour)), 2))
+def inversion_mutation(tour: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    i, j = np.sort(rng.choice(len(tour), 2, replace=False))
     tour[i : j + 1] = tour[i : j + 1][::-1]
     return tour
 
 
-def scramble_mutation(tour: np.ndarray) -> np.ndarray:
-    i, j = sorted(random.sample(range(len(tour)), 2))
-    sub_tour = tour[i : j + 1]
-    random.shuffle(sub_tour)
-    tour[i : j + 1] = sub_tour
+def scramble_mutation(tour: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    i, j = np.sort(rng.choice(len(tour), 2, replace=False))
+    tour[i : j + 1] = rng.permutation(tour[i : j + 1])
     return tour
 
 
-def insert_mutation(tour: np.ndarray) -> np.ndarray:
-    i = random.randint(0, len(tour) - 1)
+def insert_mutation(tour: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    i = rng.integers(len(tour))
     city = tour[i]
     tour = np.delete(tour, i)  # Remove the city
-    j = random.randint(0, len(tour))  # New position can be at the end
+    j = rng.integers(len(tour) + 1)  # New position can be at the end
     tour = np.insert(tour, j, city)  # Insert the city
     return tour
 
 
-def displacement_mutation(tour: np.ndarray) -> np.ndarray:
-    i, j = sorted(random.sample(range(len(tour)), 2))
+def displacement_mutation(tour: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    i, j = np.sort(rng.choice(len(tour), 2, replace=False))
     segment = tour[i : j + 1]
     tour = np.delete(tour, slice(i, j + 1))  # Remove the segment
-    insert_pos = random.randint(0, len(tour))  # Can be inserted at the end
+    insert_pos = rng.integers(len(tour) + 1)  # Can be inserted at the end
     tour = np.insert(tour, insert_pos, segment)  # Insert the segment
     return tour
 
 
-def two_opt_mutation(tour: np.ndarray) -> np.ndarray:
-    i, j = sorted(random.sample(range(len(tour)), 2))
-    tour[i : j + 1] = reversed(tour[i : j + 1])
+def two_opt_mutation(tour: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    i, j = np.sort(rng.choice(len(tour), 2, replace=False))
+    tour[i : j + 1] = tour[i : j + 1][::-1]
     return tour
 
 
+MUTATION_ALGORITHMS = {
+    "swap": swap_mutation,
+    "inversion": inversion_mutation,
+    "scramble": scramble_mutation,
+    "insert": insert_mutation,
+    "displacement": displacement_mutation,
+    "two_opt": two_opt_mutation,
+}
+
+
+def mutate_tour(
+    tour: np.ndarray, mutation_algo: str, rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Applies one mutation algorithm to an open tour (the return edge is implicit).
+    """
+    if mutation_algo == "swap":
+        return swap_mutation(tour, rng=rng)
+    return MUTATION_ALGORITHMS[mutation_algo](tour, rng=rng)
+
+
 def mutation(
-    gen: np.ndarray, mutation_rate: float = 0.01, mutation_algo: str = "swap"
+    gen: np.ndarray,
+    mutation_rate: float = 0.01,
+    mutation_algo: str = "swap",
+    rng: np.random.Generator = None,
 ) -> np.ndarray:
     """
     Perform mutation on multiple TSP routes (2D array) with a given mutation rate and mutation algorithm.
@@ -76,22 +99,16 @@ def mutation(
     - gen (np.ndarray): A 2D numpy array where each row represents a tour (chromosome).
     - mutation_rate (float): Probability of mutation for each tour, default is 0.01 (1%).
     - mutation_algo (str): Mutation algorithm, default is "swap_mutation".
+    - rng (np.random.Generator): Random number generator of the run. A fresh unseeded one is used if omitted.
 
     Returns:
     - np.ndarray: The mutated 2D array of tours.
     """
 
-    mutation_algo_dict = {
-        "swap": swap_mutation,
-        "inversion": inversion_mutation,
-        "scramble": scramble_mutation,
-        "insert": insert_mutation,
-        "displacement": displacement_mutation,
-        "two_opt": two_opt_mutation,
-    }
-
-    for idx, tour in enumerate(gen):
-        if np.random.rand() < mutation_rate:
-            gen[idx] = mutation_algo_dict[mutation_algo](tour)
+    rng = np.random.default_rng() if rng is None else rng
+
+    # One bulk draw decides which tours are mutated this generation
+    for idx in np.nonzero(rng.random(len(gen)) < mutation_rate)[0]:
+        gen[idx] = mutate_tour(gen[idx], mutation_algo, rng)
 
     return gen
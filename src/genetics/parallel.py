@@ -0,0 +1,125 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import numpy as np
+
+from genetics.crossover import crossover
+from genetics.mutation import mutation
+from genetics.parameters import Params
+from genetics.selection import calculate_fitness, tournament_selection
+
+
+class ChunkedExecutor:
+    """
+    Runs calculate_fitness and evolve_population over row blocks of the population
+    on a persistent thread pool.
+
+    Only the fitness evaluation scales with threads: its distance gather and sum are
+    NumPy kernels that release the GIL. Breeding is run in blocks too, but its
+    per-pair crossover loop is Python code that holds the GIL, so it takes as long on
+    N threads as on one and will not scale until the crossover operators work on
+    whole batches of parents. Every block writes into its own slice of a
+    preallocated output array and draws from its own generator, spawned from the
+    run's generator each generation, so a run gives the same result for any number
+    of threads.
+
+    Create one executor and pass it to several runs to reuse the pool, or set
+    params.threads to let run_genetic_algorithm manage one.
+    """
+
+    def __init__(self, threads: int = None, chunk_size: int = 1024):
+        self.threads = threads if threads is not None else os.cpu_count()
+        # Even blocks keep both children of a crossover pair in the same block
+        self.chunk_size = max(2, chunk_size + chunk_size % 2)
+        self.pool = ThreadPoolExecutor(max_workers=self.threads)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def shutdown(self):
+        self.pool.shutdown()
+
+    def chunks(self, num_rows: int) -> List[slice]:
+        return [
+            slice(start, min(start + self.chunk_size, num_rows))
+            for start in range(0, num_rows, self.chunk_size)
+        ]
+
+    def run(self, task: Callable, chunks: List, *args):
+        """
+        Calls task(chunk, *args) for every chunk on the pool and waits for all of them.
+        """
+        futures = [self.pool.submit(task, chunk, *args) for chunk in chunks]
+        for future in futures:
+            future.result()
+
+    def calculate_fitness(
+        self, population: np.ndarray, distance_matrix: np.ndarray
+    ) -> np.ndarray:
+        fitness_scores = np.empty(len(population), dtype=np.float64)
+
+        def evaluate(rows):
+            fitness_scores[rows] = calculate_fitness(population[rows], distance_matrix)
+
+        self.run(evaluate, self.chunks(len(population)))
+        return fitness_scores
+
+    def evolve_population(
+        self,
+        population: np.ndarray,
+        fitness_scores: np.ndarray,
+        params: Params,
+        rng: np.random.Generator,
+        distance_matrix: np.ndarray = None,
+    ) -> np.ndarray:
+        """
+        Chunked counterpart of genetics.evolve_population: elites are copied first,
+        then every block selects its own parents and produces its slice of offspring.
+        """
+        new_population = np.empty_like(population)
+
+        # Step 1: Elitism - retain the top elite_size individuals
+        elite_indices = fitness_scores.argsort()[-params.elite_size :][::-1]
+        new_population[: params.elite_size] = population[elite_indices]
+
+        offspring = new_population[params.elite_size :]
+        chunks = self.chunks(len(offspring))
+        rngs = rng.spawn(len(chunks))
+
+        def breed(index):
+            rows, chunk_rng = chunks[index], rngs[index]
+            num_parents = rows.stop - rows.start
+
+            # Step 2: Selection - tournaments for this block's parents
+            parents = tournament_selection(
+                population,
+                fitness_scores,
+                params.tournament_size,
+                num_parents,
+                chunk_rng,
+            )
+
+            # Step 3: Crossover - children go straight into the output slice
+            block = offspring[rows]
+            for i in range(0, num_parents, 2):
+                parent2 = parents[i + 1] if i + 1 < num_parents else parents[0]
+                child1, child2 = crossover(
+                    parents[i],
+                    parent2,
+                    params.crossover_type,
+                    chunk_rng,
+                    distance_matrix,
+                )
+                block[i] = child1
+                if i + 1 < num_parents:
+                    block[i + 1] = child2
+
+            # Step 4: Mutation - in place on the output slice
+            mutation(block, params.mutation_rate, params.mutation_type, chunk_rng)
+
+        self.run(breed, range(len(chunks)))
+        return new_population
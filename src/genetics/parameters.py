@@ -11,6 +11,9 @@ class Params:
     mutation_type: str = "swap"
     crossover_type: str = "ox"
     initial_population: str = "nn"
+    adaptive: bool = False
+    threads: int = 1
+    chunk_size: int = 1024
 
 
 from itertools import product
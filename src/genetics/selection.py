@@ -7,12 +7,17 @@ def calculate_fitness(
     """
     Calculates the fitness scores for each route in the population.
     Fitness is defined as the inverse of the total distance.
+
+    Routes are open permutations of the cities; the edge from the last city back to
+    the first is added here. Closed routes (first city repeated at the end) give the
+    same length, as their extra edge has zero length.
     """
     from_cities = population[:, :-1]  # All but the last city
     to_cities = population[:, 1:]  # All but the first city
 
-    # Compute the distances for all routes in one go
+    # Compute the distances for all routes in one go, plus the wrap-around edge
     total_distances = np.sum(distance_matrix[from_cities, to_cities], axis=1)
+    total_distances += distance_matrix[population[:, -1], population[:, 0]]
 
     # Avoid division by zero (using np.where for safe computation)
     fitness_scores = np.divide(
@@ -27,7 +32,13 @@ def calculate_fitness(
     return fitness_scores
 
 
-def tournament_selection(population, fitness_scores, tournament_size, num_parents):
+def tournament_selection(
+    population,
+    fitness_scores,
+    tournament_size,
+    num_parents,
+    rng: np.random.Generator = None,
+):
     """
     Selects parents using tournament selection, but picks the best individual from each tournament.
 
@@ -35,13 +46,15 @@ def tournament_selection(population, fitness_scores, tournament_size, num_parent
     :param fitness_scores: The fitness scores of the population.
     :param tournament_size: The number of individuals participating in each tournament.
     :param num_parents: The number of parents to select.
+    :param rng: Random number generator of the run. A fresh unseeded one is used if omitted.
     :return: The selected parents in a list.
     """
+    rng = np.random.default_rng() if rng is None else rng
     population_size = len(population)
 
     # Randomly select tournament_size individuals for the tournament at once
-    tournament_indices = np.random.choice(
-        population_size, (num_parents, tournament_size)
+    tournament_indices = rng.integers(
+        population_size, size=(num_parents, tournament_size)
     )
 
     # Get the fitness scores of the participants
@@ -0,0 +1,141 @@
+import hashlib
+import os
+from contextlib import contextmanager
+
+import numpy as np
+
+from genetics.initialize import close_routes, open_routes
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def instance_key(cities: np.ndarray) -> str:
+    """
+    Returns a content hash of the instance coordinates (city IDs are ignored).
+    Integer coordinates are hashed as int64 and floats as float64, so an instance
+    gets the same key whichever loader produced it (int32 .npy, int64 CSV/JSON),
+    while instances that differ only in fractional coordinates do not collide.
+    """
+    coords = np.asarray(cities)[:, 1:]
+    dtype = np.int64 if np.issubdtype(coords.dtype, np.integer) else np.float64
+    coords = np.ascontiguousarray(coords, dtype=dtype)
+    header = f"{coords.dtype.str}{coords.shape}".encode()
+    return hashlib.sha1(header + coords.tobytes()).hexdigest()
+
+
+def route_lengths(routes: np.ndarray, cities: np.ndarray) -> np.ndarray:
+    """
+    Lengths of open or closed routes, computed from the coordinates of their edges
+    only and truncated per edge like get_distance_matrix, so no matrix is needed.
+    """
+    tours = open_routes(np.atleast_2d(routes))
+    coords = cities[:, 1:]
+    edges = coords[tours] - coords[np.roll(tours, -1, axis=1)]
+    return np.sqrt((edges**2).sum(axis=2)).astype(int).sum(axis=1)
+
+
+def canonical_tour(route: np.ndarray) -> np.ndarray:
+    """
+    Rotates a tour to start at city 0 and picks the direction with the smaller
+    second city, so equal tours compare equal whatever their start and direction.
+    """
+    tour = open_routes(route)
+    tour = np.roll(tour, -int(np.argmin(tour)))
+    if len(tour) > 2 and tour[1] > tour[-1]:
+        tour = np.concatenate((tour[:1], tour[:0:-1]))
+    return tour
+
+
+@contextmanager
+def _file_lock(path: str):
+    with open(path, "a+b") as file:
+        if fcntl is not None:
+            fcntl.flock(file, fcntl.LOCK_EX)
+        else:
+            file.seek(0)
+            msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(file, fcntl.LOCK_UN)
+            else:
+                file.seek(0)
+                msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class SolutionStore:
+    """
+    Persistent store of the best distinct tours found per instance.
+
+    Tours are kept per instance content hash in <directory>/<key>.npz, at most top_k
+    of them, shortest first. Updates take an exclusive file lock and replace the file
+    atomically, so several processes or threads (e.g. search_grid workers) can add
+    tours concurrently while readers never see a partial file.
+
+    Pass a store to run_genetic_algorithm (solutions=...) to seed the initial
+    population with the stored tours and to add the run's best tour afterwards.
+    """
+
+    def __init__(self, directory: str, top_k: int = 10):
+        self.directory = directory
+        self.top_k = top_k
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def _load(self, key: str):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None, None
+        with np.load(path) as data:
+            return data["routes"], data["lengths"]
+
+    def best(self, cities: np.ndarray, k: int = None) -> np.ndarray:
+        """
+        Returns up to k stored closed routes of the instance, shortest first.
+        """
+        routes, _ = self._load(instance_key(cities))
+        if routes is None:
+            return np.empty((0, len(cities) + 1), dtype=int)
+        return close_routes(routes[:k].astype(int))
+
+    def add(self, cities: np.ndarray, routes: np.ndarray) -> int:
+        """
+        Merges open or closed routes into the instance's top_k distinct tours.
+        Returns the number of tours stored for the instance.
+        """
+        key = instance_key(cities)
+        new_routes = np.array([canonical_tour(r) for r in np.atleast_2d(routes)])
+        new_lengths = route_lengths(new_routes, cities)
+
+        with _file_lock(self._path(key) + ".lock"):
+            routes, lengths = self._load(key)
+            if routes is not None:
+                new_routes = np.vstack((routes, new_routes))
+                new_lengths = np.concatenate((lengths, new_lengths))
+
+            order = np.argsort(new_lengths, kind="stable")
+            kept, seen = [], set()
+            for i in order:
+                signature = new_routes[i].tobytes()
+                if signature not in seen:
+                    seen.add(signature)
+                    kept.append(i)
+                if len(kept) == self.top_k:
+                    break
+
+            temporary_path = self._path(key) + ".tmp"
+            with open(temporary_path, "wb") as file:
+                np.savez(
+                    file,
+                    routes=new_routes[kept].astype(np.int32),
+                    lengths=new_lengths[kept],
+                )
+            os.replace(temporary_path, self._path(key))
+        return len(kept)
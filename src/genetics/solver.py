@@ -0,0 +1,103 @@
+import logging
+from typing import Callable
+
+import numpy as np
+
+from genetics.exact import held_karp, nearest_neighbor_local_search
+from genetics.genetics import run_genetic_algorithm
+from genetics.initialize import get_distance_matrix, open_routes, validate_cities
+from genetics.parameters import Params
+from genetics.selection import calculate_fitness
+
+EXACT_MAX_CITIES = 12
+LOCAL_SEARCH_MAX_CITIES = 100
+
+
+class SolverResult(tuple):
+    """
+    The (best_route, best_fitness, best_fitness_history, best_route_history) tuple
+    of run_genetic_algorithm, with the solver that produced it as `method`
+    ("held_karp", "local_search" or "genetic") and whether the route is
+    `proven_optimal`. It still unpacks as the 4-tuple.
+    """
+
+    def __new__(
+        cls,
+        best_route,
+        best_fitness,
+        best_fitness_history,
+        best_route_history,
+        method: str,
+        proven_optimal: bool = False,
+    ):
+        result = super().__new__(
+            cls, (best_route, best_fitness, best_fitness_history, best_route_history)
+        )
+        result.method = method
+        result.proven_optimal = proven_optimal
+        return result
+
+    def __getnewargs__(self):
+        return (*self, self.method, self.proven_optimal)
+
+
+def solve_tsp(
+    cities: np.ndarray,
+    params: Params,
+    exact_max_cities: int = EXACT_MAX_CITIES,
+    local_search_max_cities: int = LOCAL_SEARCH_MAX_CITIES,
+    rng: np.random.Generator = None,
+    distance_matrix: np.ndarray = None,
+    callback: Callable = None,
+):
+    """
+    Dispatches an instance to the cheapest solver that handles its size.
+
+    - n <= exact_max_cities: Held-Karp dynamic programming (proven optimal).
+    - n <= local_search_max_cities: 2-opt/Or-opt local search from nearest neighbor seeds.
+    - otherwise: run_genetic_algorithm with the given params.
+
+    Returns a SolverResult: the same (best_route, best_fitness, best_fitness_history,
+    best_route_history) tuple as run_genetic_algorithm, so it can be used as a drop-in
+    replacement, with result.proven_optimal set only by Held-Karp.
+
+    distance_matrix and callback are passed on to run_genetic_algorithm. The exact and
+    local-search solvers have no generations: they call callback once, as
+    callback(0, population, fitness_scores) with their final route, so progress
+    listeners still get an update.
+    """
+    num_cities = cities.shape[0]
+    if num_cities > local_search_max_cities:
+        return SolverResult(
+            *run_genetic_algorithm(
+                cities,
+                params,
+                rng,
+                distance_matrix=distance_matrix,
+                callback=callback,
+            ),
+            "genetic",
+        )
+
+    validate_cities(cities)
+    if distance_matrix is None:
+        distance_matrix = get_distance_matrix(cities)
+
+    if num_cities <= exact_max_cities:
+        best_route = held_karp(distance_matrix)
+        method, proven_optimal = "held_karp", True
+        logging.info(f"Held-Karp: route is proven optimal for {num_cities} cities.")
+    else:
+        best_route = nearest_neighbor_local_search(distance_matrix)
+        method, proven_optimal = "local_search", False
+        logging.info(
+            f"Local search: route is a 2-opt/Or-opt local optimum for {num_cities} "
+            "cities."
+        )
+
+    best_fitness = calculate_fitness(best_route[None, :], distance_matrix)[0]
+    if callback is not None:
+        callback(0, open_routes(best_route)[None, :], np.array([best_fitness]))
+    return SolverResult(
+        best_route, best_fitness, [best_fitness], [best_route], method, proven_optimal
+    )
@@ -0,0 +1,155 @@
+import heapq
+import logging
+from typing import Callable
+
+import numpy as np
+
+from genetics.crossover import crossover
+from genetics.initialize import (
+    close_routes,
+    gen_population,
+    get_distance_matrix,
+    open_routes,
+    validate_cities,
+)
+from genetics.mutation import mutation
+from genetics.parameters import Params
+from genetics.selection import calculate_fitness
+
+REPLACEMENTS = ("worst", "parent")
+
+
+class FitnessIndex:
+    """
+    Min-heap over the fitness of the population slots, so the worst individual is
+    found and replaced in O(log P).
+
+    Replacing an arbitrary slot (e.g. a parent) only pushes a new entry; the outdated
+    entry of that slot is skipped lazily when it reaches the top of the heap.
+    """
+
+    def __init__(self, fitness_scores: np.ndarray):
+        self.fitness_scores = fitness_scores
+        self.versions = np.zeros(len(fitness_scores), dtype=int)
+        self.heap = [(f, slot, 0) for slot, f in enumerate(fitness_scores.tolist())]
+        heapq.heapify(self.heap)
+
+    def worst(self) -> int:
+        while True:
+            fitness, slot, version = self.heap[0]
+            if version == self.versions[slot]:
+                return slot
+            heapq.heappop(self.heap)
+
+    def replace(self, slot: int, fitness: float):
+        self.fitness_scores[slot] = fitness
+        self.versions[slot] += 1
+        heapq.heappush(self.heap, (fitness, slot, int(self.versions[slot])))
+        # Keep the lazily deleted entries from piling up
+        if len(self.heap) > 4 * len(self.fitness_scores):
+            self.heap = [
+                (f, s, int(self.versions[s])) for s, f in enumerate(self.fitness_scores)
+            ]
+            heapq.heapify(self.heap)
+
+
+def run_steady_state_genetic_algorithm(
+    cities: np.ndarray,
+    params: Params,
+    rng: np.random.Generator = None,
+    distance_matrix: np.ndarray = None,
+    initial_routes: np.ndarray = None,
+    callback: Callable = None,
+    batch_size: int = None,
+    replacement: str = "worst",
+):
+    """
+    Steady-state variant of run_genetic_algorithm with the same inputs and outputs.
+
+    Instead of rebuilding the population every generation, each step breeds a batch
+    of batch_size children (tournament selection, then the configured crossover and
+    mutation operators) and inserts every child that beats the individual it
+    replaces: the current worst of the population (replacement="worst") or the
+    worse of its two parents (replacement="parent"). The best tour is never lost.
+
+    To keep the evaluation budget comparable, one "generation" is population_size
+    child evaluations: the fitness and route histories and the callback advance
+    once per generation, and params.generations of them are run.
+
+    Supported Params: population_size, generations, tournament_size, mutation_rate,
+    mutation_type, crossover_type and initial_population. elite_size is not needed
+    (the best tour is never replaced), and params.adaptive, params.threads and
+    params.chunk_size are not supported: the loop always runs with fixed operators
+    on one thread, and a warning is logged if they are set.
+    """
+    if replacement not in REPLACEMENTS:
+        raise ValueError(f"Invalid replacement, expected one of {REPLACEMENTS}")
+    if params.adaptive or params.threads > 1:
+        logging.warning(
+            "Steady-state GA ignores params.adaptive, params.threads and "
+            "params.chunk_size; running with fixed operators on one thread."
+        )
+    rng = np.random.default_rng() if rng is None else rng
+    validate_cities(cities)
+    if distance_matrix is None:
+        distance_matrix = get_distance_matrix(cities)
+
+    population = gen_population(
+        params.initial_population, params.population_size, distance_matrix, rng
+    )
+    if initial_routes is not None and len(initial_routes):
+        seeds = open_routes(initial_routes)[: params.population_size]
+        population[: len(seeds)] = seeds
+    fitness_scores = calculate_fitness(population, distance_matrix)
+    index = FitnessIndex(fitness_scores)
+
+    population_size = len(population)
+    batch_size = batch_size or max(2, population_size // 10)
+    batch_size += batch_size % 2
+    best_fitness_history = []
+    best_route_history = []
+
+    for generation in range(params.generations):
+        best_index = fitness_scores.argmax()
+        best_fitness_history.append(fitness_scores[best_index])
+        best_route_history.append(close_routes(population[best_index]))
+        if callback is not None:
+            callback(generation, population, fitness_scores)
+
+        evaluations = 0
+        while evaluations < population_size:
+            # Tournament indices rather than tours, to know the parents' slots
+            contestants = rng.integers(
+                population_size, size=(batch_size, params.tournament_size)
+            )
+            winners = contestants[
+                np.arange(batch_size), fitness_scores[contestants].argmax(axis=1)
+            ]
+
+            children = np.empty((batch_size, population.shape[1]), dtype=int)
+            for i in range(0, batch_size, 2):
+                children[i], children[i + 1] = crossover(
+                    population[winners[i]],
+                    population[winners[i + 1]],
+                    params.crossover_type,
+                    rng,
+                    distance_matrix,
+                )
+            mutation(children, params.mutation_rate, params.mutation_type, rng)
+            child_fitness = calculate_fitness(children, distance_matrix)
+            evaluations += batch_size
+
+            for i in range(batch_size):
+                if replacement == "worst":
+                    slot = index.worst()
+                else:
+                    pair = winners[i - i % 2 : i - i % 2 + 2]
+                    slot = pair[fitness_scores[pair].argmin()]
+                if child_fitness[i] > fitness_scores[slot]:
+                    population[slot] = children[i]
+                    index.replace(slot, child_fitness[i])
+
+    best_index = fitness_scores.argmax()
+    best_route = close_routes(population[best_index])
+    best_fitness = fitness_scores[best_index]
+    return best_route, best_fitness, best_fitness_history, best_route_history
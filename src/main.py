@@ -11,7 +11,7 @@ if __name__ == "__main__":
 
     @timing("run_ga")
     def run_ga():
-        np.random.seed(42)
+        rng = np.random.default_rng(42)
 
         # Parameters
         params = Params(
@@ -24,7 +24,7 @@ if __name__ == "__main__":
             crossover_type="ox",
         )
 
-        best_route, best_fitness, rh, fh = run_genetic_algorithm(cities, params)
+        best_route, best_fitness, rh, fh = run_genetic_algorithm(cities, params, rng)
         plot_route(best_route, cities)
         print(f"Best route: {best_route}")
         print(f"Best fitness: {best_fitness}")
@@ -39,7 +39,7 @@ if __name__ == "__main__":
             mutation_rates=[0.05],
         )
         results = search_grid(
-            cities, param_grid, run_genetic_algorithm, multithreading=False
+            cities, param_grid, run_genetic_algorithm, multithreading=False, seed=42
         )
         print(f"Results: {len(results)}")
 
@@ -0,0 +1,347 @@
+"""
+Local solver service: a long-running HTTP server in front of a pre-warmed process pool.
+
+Workers import the solver once, run a warm-up solve and keep an LRU cache of distance
+matrices keyed by instance content, so repeated instances skip the matrix build.
+Usage: cd src && python -m service.server [--port 8765] [--workers 4]
+
+Endpoints:
+- POST /jobs              Submit a job. JSON body:
+                          {"cities": [[id, x, y], ...] or "coords": [[x, y], ...],
+                           "params": {...Params fields...}, "seed": 42, "solver": "ga"}
+                          or a binary .npy body (Content-Type: application/x-npy) with
+                          params, seed and solver in the X-Params, X-Seed and X-Solver
+                          headers. Returns {"job_id": ...}.
+- GET  /jobs/<id>         Poll the job status, progress and result.
+- GET  /jobs/<id>/events  Stream status updates as server-sent events until the job ends.
+- GET  /status            Worker count and number of queued, running and finished jobs.
+
+Finished jobs are kept for --job-ttl seconds (at most --max-finished of them); polling
+an evicted job returns 404 and its event stream ends with status "expired".
+
+solver is "ga" (run_genetic_algorithm) or "auto" (solve_tsp).
+"""
+
+import argparse
+import io
+import json
+import logging
+import multiprocessing
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+from genetics.genetics import run_genetic_algorithm
+from genetics.initialize import get_distance_matrix
+from genetics.parameters import Params
+from genetics.solutions import instance_key
+from genetics.solver import solve_tsp
+
+CACHE_SIZE = 16
+PROGRESS_REPORTS = 20  # progress messages per job
+FINISHED = ("done", "error", "expired")
+
+# Per worker process state
+_distance_cache = OrderedDict()
+_progress_queue = None
+
+
+def _init_worker(progress_queue):
+    global _progress_queue
+    _progress_queue = progress_queue
+
+    # Warm-up solve so imports and numpy kernels are ready before the first job
+    cities = np.array([[i, (7 * i) % 10, (3 * i) % 10] for i in range(6)])
+    run_genetic_algorithm(cities, Params(4, 1, 1, 2, 0.0), np.random.default_rng(0))
+
+
+def cached_distance_matrix(cities: np.ndarray) -> np.ndarray:
+    """
+    Returns the distance matrix of the instance from the worker's LRU cache.
+    """
+    key = instance_key(cities)
+    if key in _distance_cache:
+        _distance_cache.move_to_end(key)
+        return _distance_cache[key]
+
+    distance_matrix = get_distance_matrix(cities)
+    _distance_cache[key] = distance_matrix
+    if len(_distance_cache) > CACHE_SIZE:
+        _distance_cache.popitem(last=False)
+    return distance_matrix
+
+
+def solve_job(job_id: str, cities: np.ndarray, params: Params, seed, solver: str):
+    """
+    Runs one job in a worker process and reports progress through the progress queue.
+    """
+    start_time = time.time()
+    _progress_queue.put((job_id, 0, None))
+    rng = np.random.default_rng(seed)
+
+    step = max(1, params.generations // PROGRESS_REPORTS)
+
+    def report(generation, population, fitness_scores):
+        if generation % step == 0:
+            _progress_queue.put((job_id, generation, float(fitness_scores.max())))
+
+    # "auto" passes both on to run_genetic_algorithm; its exact and local-search
+    # solvers report once, with their final route
+    solve = solve_tsp if solver == "auto" else run_genetic_algorithm
+    result = solve(
+        cities,
+        params,
+        rng=rng,
+        distance_matrix=cached_distance_matrix(cities),
+        callback=report,
+    )
+
+    best_route, best_fitness = result[0], float(result[1])
+    return {
+        "best_route": np.asarray(best_route).tolist(),
+        "best_fitness": best_fitness,
+        "length": 1 / best_fitness if best_fitness > 0 else None,
+        "duration": time.time() - start_time,
+        "method": getattr(result, "method", "genetic"),
+        "proven_optimal": getattr(result, "proven_optimal", False),
+    }
+
+
+class JobQueue:
+    """
+    Tracks jobs submitted to the worker pool and their progress.
+    """
+
+    def __init__(
+        self, workers: int = None, job_ttl: float = 3600, max_finished: int = 1000
+    ):
+        # Finished jobs (with their routes) are kept for job_ttl seconds, and at
+        # most max_finished of them, so a long-running service does not grow forever
+        self.job_ttl = job_ttl
+        self.max_finished = max_finished
+        self.progress = multiprocessing.Queue()
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.progress,)
+        )
+        self.jobs = {}
+        self.changed = threading.Condition()
+        threading.Thread(target=self._drain_progress, daemon=True).start()
+
+        # Start every worker now so that no request pays for process start-up
+        workers = self.executor._max_workers
+        for future in [self.executor.submit(time.sleep, 0.1) for _ in range(workers)]:
+            future.result()
+
+    def submit(self, cities: np.ndarray, params: Params, seed, solver: str) -> str:
+        job_id = uuid.uuid4().hex
+        with self.changed:
+            self._evict()
+            self.jobs[job_id] = {
+                "job_id": job_id,
+                "status": "queued",
+                "generation": 0,
+                "generations": params.generations,
+                "best_fitness": None,
+                "submitted": time.time(),
+                "version": 0,
+            }
+        future = self.executor.submit(solve_job, job_id, cities, params, seed, solver)
+        future.add_done_callback(lambda f: self._finish(job_id, f))
+        return job_id
+
+    def _update(self, job_id: str, **values):
+        with self.changed:
+            job = self.jobs[job_id]
+            job.update(values)
+            job["version"] += 1
+            self.changed.notify_all()
+
+    def _evict(self):
+        """
+        Drops finished jobs older than job_ttl, then the oldest beyond max_finished.
+        Must be called with self.changed held.
+        """
+        now = time.time()
+        finished = sorted(
+            (job["finished"], job_id)
+            for job_id, job in self.jobs.items()
+            if job["status"] in FINISHED
+        )
+        excess = len(finished) - self.max_finished
+        for i, (finished_at, job_id) in enumerate(finished):
+            if i < excess or now - finished_at > self.job_ttl:
+                del self.jobs[job_id]
+
+    def _drain_progress(self):
+        while True:
+            job_id, generation, best_fitness = self.progress.get()
+            # Check and update under one lock, so a late progress message can never
+            # move a job that _finish has just completed back to "running"
+            with self.changed:
+                job = self.jobs.get(job_id)
+                if job is None or job["status"] not in ("queued", "running"):
+                    continue
+                values = {"status": "running", "generation": generation}
+                if best_fitness is not None:
+                    values["best_fitness"] = best_fitness
+                self._update(job_id, **values)
+
+    def _finish(self, job_id: str, future):
+        try:
+            result = future.result()
+            with self.changed:
+                self._update(
+                    job_id,
+                    status="done",
+                    result=result,
+                    best_fitness=result["best_fitness"],
+                    generation=self.jobs[job_id]["generations"],
+                    latency=time.time() - self.jobs[job_id]["submitted"],
+                    finished=time.time(),
+                )
+                self._evict()
+        except Exception as e:
+            logging.error(f"Job {job_id} failed: {e}")
+            self._update(job_id, status="error", error=str(e), finished=time.time())
+
+    def snapshot(self, job_id: str) -> dict:
+        with self.changed:
+            return dict(self.jobs[job_id]) if job_id in self.jobs else None
+
+    def wait_for_change(self, job_id: str, version: int, timeout: float) -> dict:
+        with self.changed:
+            self.changed.wait_for(
+                lambda: job_id not in self.jobs
+                or self.jobs[job_id]["version"] != version,
+                timeout=timeout,
+            )
+            if job_id not in self.jobs:
+                return {"job_id": job_id, "status": "expired", "version": version}
+            return dict(self.jobs[job_id])
+
+    def status(self) -> dict:
+        with self.changed:
+            statuses = [job["status"] for job in self.jobs.values()]
+        return {
+            "workers": self.executor._max_workers,
+            **{s: statuses.count(s) for s in ("queued", "running", "done", "error")},
+        }
+
+
+def parse_job(content_type: str, body: bytes, headers) -> tuple:
+    """
+    Parses a job request into (cities, params, seed, solver).
+    """
+    if content_type == "application/x-npy":
+        cities = np.load(io.BytesIO(body), allow_pickle=False)
+        params = json.loads(headers.get("X-Params", "{}"))
+        seed = headers.get("X-Seed")
+        seed = int(seed) if seed is not None else None
+        solver = headers.get("X-Solver", "ga")
+    else:
+        request = json.loads(body)
+        cities = np.asarray(request.get("cities", request.get("coords")))
+        params = request.get("params", {})
+        seed = request.get("seed")
+        solver = request.get("solver", "ga")
+
+    if cities.ndim != 2 or cities.shape[1] < 2:
+        raise ValueError(
+            "Expected cities as [[id, x, y], ...] or coords as [[x, y], ...]"
+        )
+    if cities.shape[1] == 2:
+        cities = np.column_stack((np.arange(len(cities)), cities))
+    if solver not in ("ga", "auto"):
+        raise ValueError("Invalid solver")
+    return cities, Params(**params), seed, solver
+
+
+def make_handler(queue: JobQueue):
+    class SolverHandler(BaseHTTPRequestHandler):
+        def _send_json(self, status: int, payload: dict):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            if self.path != "/jobs":
+                return self._send_json(404, {"error": "Not found"})
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            try:
+                job = parse_job(self.headers.get("Content-Type"), body, self.headers)
+            except (ValueError, TypeError, KeyError) as e:
+                return self._send_json(400, {"error": str(e)})
+            self._send_json(202, {"job_id": queue.submit(*job)})
+
+        def do_GET(self):
+            parts = self.path.strip("/").split("/")
+            if parts == ["status"]:
+                return self._send_json(200, queue.status())
+            if len(parts) < 2 or parts[0] != "jobs":
+                return self._send_json(404, {"error": "Not found"})
+
+            job = queue.snapshot(parts[1])
+            if job is None:
+                return self._send_json(404, {"error": "Unknown job"})
+            if len(parts) == 2:
+                return self._send_json(200, job)
+            if parts[2] == "events":
+                return self._stream(job)
+            self._send_json(404, {"error": "Not found"})
+
+        def _stream(self, job: dict):
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            while True:
+                self.wfile.write(f"data: {json.dumps(job)}\n\n".encode())
+                self.wfile.flush()
+                if job["status"] in FINISHED:
+                    return
+                job = queue.wait_for_change(job["job_id"], job["version"], timeout=15)
+
+        def log_message(self, format, *args):
+            logging.debug(format % args)
+
+    return SolverHandler
+
+
+def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    workers: int = None,
+    job_ttl: float = 3600,
+    max_finished: int = 1000,
+):
+    queue = JobQueue(workers, job_ttl, max_finished)
+    server = ThreadingHTTPServer((host, port), make_handler(queue))
+    logging.info(
+        f"Solver service on http://{host}:{port} with "
+        f"{queue.executor._max_workers} workers"
+    )
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        queue.executor.shutdown(cancel_futures=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local TSP solver service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--job-ttl", type=float, default=3600)
+    parser.add_argument("--max-finished", type=int, default=1000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="d-%(levelname)s-%(message)s")
+    serve(args.host, args.port, args.workers, args.job_ttl, args.max_finished)
@@ -1,3 +1,27 @@
-from .plot import *
-from .coordinatesGenerator import *
-from .load import *
+from tools.lazy import lazy_module
+
+# Public names are resolved on first access (PEP 562): plotting pulls in
+# matplotlib, which headless solver processes should never pay for.
+_LAZY_ATTRIBUTES = {
+    "plot_route": ".plot",
+    "plot_routes": ".plot",
+    "plot_fitness": ".plot",
+    "plot_gridsearch_result": ".plot",
+    "plot_comparison": ".plot",
+    "route_coordinates": ".plot",
+    "save_route_frames": ".plot",
+    "eu_countries": ".coordinatesGenerator",
+    "generate_contries": ".coordinatesGenerator",
+    "load_cities_name": ".load",
+    "load_dataset": ".load",
+    "load_csv": ".load",
+    "load_npy": ".load",
+    "generate_instance": ".instanceGenerator",
+    "generate_blocks": ".instanceGenerator",
+    "write_instance": ".instanceGenerator",
+    "MetricsExporter": ".metrics",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
@@ -1,6 +1,6 @@
-import random
-import numpy as np
+import os
 
+import numpy as np
 
 eu_countries = [
     "Albania",
@@ -55,9 +55,20 @@ eu_countries = [
 ]
 
 
-def generate_contries():
-    coordinates = np.random.randint(100, size=(len(eu_countries), 2))
-    f = open("../../data/countries.csv", "a")
-    f.write("Country ID, X-coordinate, Y-coordinate\n")
-    for i in range(coordinates.shape[0]):
-        f.write(f"{i}, {coordinates[i,0]}, {coordinates[i,1]}\n")
+COUNTRIES_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "data", "countries.csv"
+)
+
+
+def generate_contries(path: str = COUNTRIES_PATH, seed=None) -> str:
+    """
+    Writes random coordinates for eu_countries to a CSV readable by load_csv.
+    The file is overwritten; for benchmark-scale instances use tools.instanceGenerator.
+    """
+    rng = np.random.default_rng(seed)
+    coordinates = rng.integers(100, size=(len(eu_countries), 2))
+    with open(path, "w") as f:
+        f.write("Country ID, X-coordinate, Y-coordinate\n")
+        for i in range(coordinates.shape[0]):
+            f.write(f"{i}, {coordinates[i,0]}, {coordinates[i,1]}\n")
+    return path
@@ -0,0 +1,183 @@
+"""
+Synthetic benchmark instances of 10^3 to 10^6+ cities.
+
+Cities are generated in blocks of BLOCK_SIZE, each block from its own generator
+spawned from one SeedSequence, so an instance only depends on (num_cities,
+distribution, seed, extent) and never has to fit in memory at once. Output is
+streamed block by block to .npy (loadable with np.load(..., mmap_mode="r") or
+tools.load.load_npy) or to CSV in the format read by tools.load.load_csv.
+
+Distributions:
+- uniform: uniform over the square [0, extent)^2.
+- clustered: Gaussian clusters around random centers.
+- grid: a regular square lattice, filled row by row.
+- road: towns spread along random straight roads, as in road networks.
+
+Usage: cd src && python -m tools.instanceGenerator 1000000 --distribution road
+       --seed 1 --output ../data/generated/road_1000000.npy
+"""
+
+import argparse
+import logging
+import math
+import os
+from typing import Iterator
+
+import numpy as np
+
+DISTRIBUTIONS = ("uniform", "clustered", "grid", "road")
+BLOCK_SIZE = 65536
+CSV_HEADER = "City ID, X-coordinate, Y-coordinate"
+
+
+def default_extent(num_cities: int) -> int:
+    """
+    Side of the square holding the cities: about 100 units between neighbors.
+    """
+    return max(100, int(100 * math.sqrt(num_cities)))
+
+
+def _layout(distribution: str, num_cities: int, extent: int, seed) -> dict:
+    """
+    Draws the shared structure of an instance: cluster centers or roads.
+    """
+    rng = np.random.default_rng(seed)
+    if distribution == "clustered":
+        num_clusters = max(1, num_cities // 1000)
+        return {
+            "centers": rng.uniform(0, extent, size=(num_clusters, 2)),
+            "sigma": extent / (4 * math.sqrt(num_clusters)),
+        }
+    if distribution == "road":
+        num_roads = max(4, int(math.sqrt(num_cities) / 4))
+        starts = rng.uniform(0, extent, size=(num_roads, 2))
+        ends = rng.uniform(0, extent, size=(num_roads, 2))
+        lengths = np.linalg.norm(ends - starts, axis=1)
+        return {
+            "starts": starts,
+            "ends": ends,
+            "weights": lengths / lengths.sum(),
+            "width": extent / (20 * math.sqrt(num_roads)),
+        }
+    return {}
+
+
+def _block(
+    distribution: str,
+    first: int,
+    size: int,
+    extent: int,
+    num_cities: int,
+    layout: dict,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    if distribution == "uniform":
+        coords = rng.uniform(0, extent, size=(size, 2))
+    elif distribution == "clustered":
+        centers = layout["centers"][rng.integers(len(layout["centers"]), size=size)]
+        coords = centers + rng.normal(0, layout["sigma"], size=(size, 2))
+    elif distribution == "grid":
+        side = math.ceil(math.sqrt(num_cities))
+        index = np.arange(first, first + size)
+        coords = np.column_stack((index % side, index // side)) * (extent / side)
+    elif distribution == "road":
+        roads = rng.choice(len(layout["weights"]), size=size, p=layout["weights"])
+        t = rng.random(size)[:, None]
+        starts, ends = layout["starts"][roads], layout["ends"][roads]
+        coords = starts + t * (ends - starts)
+        coords += rng.normal(0, layout["width"], size=(size, 2))
+    else:
+        raise ValueError(f"Invalid distribution, expected one of {DISTRIBUTIONS}")
+
+    coords = np.clip(coords, 0, extent - 1).astype(np.int64)
+    return np.column_stack((np.arange(first, first + size), coords))
+
+
+def generate_blocks(
+    num_cities: int,
+    distribution: str = "uniform",
+    seed=None,
+    extent: int = None,
+) -> Iterator[np.ndarray]:
+    """
+    Yields the instance as (m, 3) int arrays [id, x, y] of up to BLOCK_SIZE cities.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Invalid distribution, expected one of {DISTRIBUTIONS}")
+    extent = default_extent(num_cities) if extent is None else extent
+    num_blocks = math.ceil(num_cities / BLOCK_SIZE)
+    layout_seed, *block_seeds = np.random.SeedSequence(seed).spawn(num_blocks + 1)
+    layout = _layout(distribution, num_cities, extent, layout_seed)
+
+    for block, block_seed in enumerate(block_seeds):
+        first = block * BLOCK_SIZE
+        size = min(BLOCK_SIZE, num_cities - first)
+        yield _block(
+            distribution,
+            first,
+            size,
+            extent,
+            num_cities,
+            layout,
+            np.random.default_rng(block_seed),
+        )
+
+
+def generate_instance(
+    num_cities: int,
+    distribution: str = "uniform",
+    seed=None,
+    extent: int = None,
+) -> np.ndarray:
+    """
+    Returns the whole instance as an (n, 3) int array, like load_csv.
+    """
+    return np.concatenate(list(generate_blocks(num_cities, distribution, seed, extent)))
+
+
+def write_instance(
+    path: str,
+    num_cities: int,
+    distribution: str = "uniform",
+    seed=None,
+    extent: int = None,
+) -> str:
+    """
+    Streams an instance to `path`: binary .npy, or CSV for any other extension.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    blocks = generate_blocks(num_cities, distribution, seed, extent)
+
+    if path.endswith(".npy"):
+        output = np.lib.format.open_memmap(
+            path, mode="w+", dtype=np.int64, shape=(num_cities, 3)
+        )
+        for block in blocks:
+            first = block[0, 0]
+            output[first : first + len(block)] = block
+        output.flush()
+        del output
+    else:
+        with open(path, "w") as file:
+            file.write(CSV_HEADER + "\n")
+            for block in blocks:
+                np.savetxt(file, block, fmt="%d", delimiter=", ")
+
+    logging.info(f"Wrote {num_cities} {distribution} cities to {path}")
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a synthetic TSP instance.")
+    parser.add_argument("num_cities", type=int)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--extent", type=int, default=None)
+    parser.add_argument("--output", help=".npy or .csv path")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="d-%(levelname)s-%(message)s")
+    output = args.output or f"{args.distribution}_{args.num_cities}.npy"
+    write_instance(output, args.num_cities, args.distribution, args.seed, args.extent)
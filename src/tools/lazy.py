@@ -0,0 +1,25 @@
+import importlib
+import sys
+from typing import Callable, Dict, Tuple
+
+
+def lazy_module(name: str, attributes: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    Returns the module-level (__getattr__, __dir__) of package `name` (PEP 562):
+    every name in `attributes` is imported from its submodule (relative to the
+    package) on first access and then cached in the package namespace.
+    """
+
+    def __getattr__(attribute):
+        if attribute in attributes:
+            module = importlib.import_module(attributes[attribute], name)
+            value = getattr(module, attribute)
+            setattr(sys.modules[name], attribute, value)
+            return value
+        raise AttributeError(f"module {name!r} has no attribute {attribute!r}")
+
+    def __dir__():
+        package = sys.modules[name]
+        return sorted(set(vars(package)) | set(getattr(package, "__all__", attributes)))
+
+    return __getattr__, __dir__
@@ -1,5 +1,7 @@
-import numpy as np
+import logging
 import os
+
+import numpy as np
 from typing import List
 
 
@@ -9,18 +11,21 @@ def load_cities_name(filename):
     return np.array(cities)
 
 
-def load_dataset(directory: str, endswith="_dataset.csv") -> List:
+def load_dataset(
+    directory: str, endswith="_dataset.csv", with_paths: bool = False
+) -> List:
     """
     Loads all dataset files in the given directory and combines them into a single array.
+    With with_paths=True, each entry is a (file_path, data) tuple instead.
     """
     combined_data = []
 
-    for filename in os.listdir(directory):
+    for filename in sorted(os.listdir(directory)):
         if filename.endswith(endswith):
             file_path = os.path.join(directory, filename)
             data = load_csv(file_path)
-            combined_data.append(data)
-            print(
+            combined_data.append((file_path, data) if with_paths else data)
+            logging.info(
                 f"Loaded dataset from {file_path} stored at index {len(combined_data) - 1}."
             )
 
@@ -44,10 +49,28 @@ def load_csv(file_path: str) -> np.ndarray:
     except Exception as e:
         raise ValueError(f"Error loading CSV file at {file_path}: {e}")
 
+    _check_city_ids(data)
+    return data
+
+
+def load_npy(file_path: str, mmap: bool = False) -> np.ndarray:
+    """
+    Loads an (n, 3) [id, x, y] instance saved with np.save, e.g. by
+    tools.instanceGenerator. With mmap=True the file is memory-mapped read-only.
+    """
+    data = np.load(file_path, mmap_mode="r" if mmap else None, allow_pickle=False)
+    if data.ndim != 2 or data.shape[1] < 3:
+        raise ValueError(
+            f"Unexpected array shape {data.shape} at {file_path}: Expected (n, 3)."
+        )
+    _check_city_ids(data)
+    return data
+
+
+def _check_city_ids(data: np.ndarray):
     city_ids = data[:, 0].astype(int)
     num_cities = data.shape[0]
-    if len(set(city_ids)) != num_cities:
+    if len(np.unique(city_ids)) != num_cities:
         raise ValueError("City IDs are not unique.")
     if city_ids.min() < 0 or city_ids.max() >= num_cities:
         raise ValueError("City IDs are out of valid range.")
-    return data
@@ -13,7 +13,7 @@ def timing(msg):
             ts = time.time()
             result = f(*args, **kw)
             te = time.time()
-            print(f"{msg} executed in: {te-ts:.4f} sec")
+            logging.info(f"{msg} executed in: {te-ts:.4f} sec")
             return result
 
         return wrap
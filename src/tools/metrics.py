@@ -0,0 +1,207 @@
+"""
+Live metrics of running solves in the Prometheus text format.
+
+A MetricsExporter keeps the latest value of every gauge in memory. The hot loops only
+update that dict; a background thread rewrites a metrics file every `interval`
+seconds (atomically, for node_exporter's textfile collector or a plain `cat`) and/or
+an HTTP endpoint serves it on GET /metrics.
+
+Usage:
+    with MetricsExporter(path="ga.prom", port=9109) as metrics:
+        run_genetic_algorithm(
+            cities, params, callback=metrics.run_callback(params.generations)
+        )
+        search_grid(cities, grid, run_genetic_algorithm, metrics=metrics)
+"""
+
+import logging
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+
+import numpy as np
+
+METRICS = {
+    "generation": "Current generation of the run",
+    "generations_total": "Number of generations of the run",
+    "best_length": "Length of the best tour of the current population",
+    "mean_length": "Mean tour length of the current population",
+    "diversity": "Share of distinct edges in a sample of the population (0 to 1)",
+    "generations_per_second": "Generations per second since the previous update",
+    "evaluations_per_second": "Fitness evaluations per second since the previous update",
+    "eta_seconds": "Estimated seconds until the run or search completes",
+    "combinations_total": "Number of parameter combinations of the search",
+    "combinations_completed": "Parameter combinations evaluated so far",
+    "queue_depth": "Parameter combinations waiting for a worker",
+    "best_search_length": "Best tour length found by the search so far",
+}
+
+
+def edge_diversity(population: np.ndarray, sample_size: int = 32) -> float:
+    """
+    Returns the share of distinct undirected edges in (a sample of) the population:
+    0 when all sampled tours are identical, 1 when they share no edge.
+    """
+    sample = population[:: max(1, len(population) // sample_size)][:sample_size]
+    if len(sample) < 2:
+        return 0.0
+    num_cities = sample.shape[1]
+    ends = np.roll(sample, -1, axis=1)
+    edges = np.minimum(sample, ends) * num_cities + np.maximum(sample, ends)
+    distinct = len(np.unique(edges))
+    return (distinct - num_cities) / (num_cities * (len(sample) - 1))
+
+
+class MetricsExporter:
+    """
+    Collects gauges labelled by run and exposes them as Prometheus text.
+
+    path: file rewritten every `interval` seconds, port: HTTP port serving /metrics.
+    Both are optional; render() returns the current text either way.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        port: int = None,
+        interval: float = 1.0,
+        host: str = "127.0.0.1",
+        prefix: str = "tsp",
+    ):
+        self.path = path
+        self.interval = interval
+        self.prefix = prefix
+        self.values: Dict[Tuple[str, str], float] = {}
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.server = None
+
+        if path is not None:
+            threading.Thread(target=self._write_loop, daemon=True).start()
+        if port is not None:
+            self.server = ThreadingHTTPServer((host, port), self._make_handler())
+            threading.Thread(target=self.server.serve_forever, daemon=True).start()
+            logging.info(f"Metrics on http://{host}:{port}/metrics")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def set(self, run: str, **values):
+        with self.lock:
+            for name, value in values.items():
+                self.values[(name, run)] = float(value)
+
+    def render(self) -> str:
+        with self.lock:
+            values = dict(self.values)
+        lines = []
+        for name, description in METRICS.items():
+            samples = [(run, v) for (n, run), v in values.items() if n == name]
+            if not samples:
+                continue
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} gauge")
+            lines.extend(f'{metric}{{run="{run}"}} {v:g}' for run, v in samples)
+        return "\n".join(lines) + "\n"
+
+    def write(self):
+        """
+        Rewrites the metrics file atomically.
+        """
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as file:
+            file.write(self.render())
+        os.replace(temporary_path, self.path)
+
+    def _write_loop(self):
+        while not self.stopped.wait(self.interval):
+            self.write()
+
+    def _make_handler(self):
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logging.debug(format % args)
+
+        return MetricsHandler
+
+    def close(self):
+        self.stopped.set()
+        if self.path is not None:
+            self.write()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+
+    def run_callback(self, generations: int, run: str = "ga", every: int = 10):
+        """
+        Returns a callback for run_genetic_algorithm that updates the run's gauges
+        every `every` generations, so the overhead stays bounded for any population.
+        """
+        state = {"time": time.time(), "generation": 0}
+        self.set(run, generations_total=generations)
+
+        def callback(generation: int, population: np.ndarray, fitness_scores):
+            if generation % every and generation != generations - 1:
+                return
+            now = time.time()
+            elapsed = now - state["time"]
+            rate = (generation - state["generation"]) / elapsed if elapsed > 0 else 0.0
+            state["time"], state["generation"] = now, generation
+
+            lengths = 1 / fitness_scores
+            self.set(
+                run,
+                generation=generation,
+                best_length=lengths.min(),
+                mean_length=lengths.mean(),
+                diversity=edge_diversity(population),
+                generations_per_second=rate,
+                evaluations_per_second=rate * len(population),
+                eta_seconds=(generations - generation - 1) / rate if rate else 0.0,
+            )
+
+        return callback
+
+    def search_progress(
+        self,
+        run: str,
+        completed: int,
+        total: int,
+        start_time: float,
+        workers: int = 1,
+        best_length: float = None,
+    ):
+        """
+        Updates the gauges of a parameter search after a combination completes.
+        """
+        elapsed = time.time() - start_time
+        values = {
+            "combinations_total": total,
+            "combinations_completed": completed,
+            "queue_depth": max(0, total - completed - workers),
+            "eta_seconds": (
+                (total - completed) * elapsed / completed if completed else 0
+            ),
+        }
+        if best_length is not None:
+            values["best_search_length"] = best_length
+        self.set(run, **values)
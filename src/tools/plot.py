@@ -1,78 +1,182 @@
+import math
+import os
 from typing import List, Callable
 
-import matplotlib.pyplot as plt
 import numpy as np
 
+try:
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+except ImportError as e:  # plotting is an optional extra
+    raise ImportError(
+        "Plotting requires matplotlib: pip install -r requirements-plot.txt"
+    ) from e
+
 from tuning import Result
 
 
-def plot_route(route, cities, eu_countries=None, title="Route"):
+def route_coordinates(route, cities, max_points: int = None) -> np.ndarray:
+    """
+    Gathers the (x, y) coordinates of a route, or of a 2D array of routes, in one
+    indexing operation. If max_points is given, routes are decimated to keep about
+    max_points cities; the first and last cities are always kept.
+    """
+    route = np.asarray(route)
+    if max_points is not None and route.shape[-1] > max_points:
+        step = math.ceil(route.shape[-1] / max_points)
+        keep = np.unique(np.r_[0 : route.shape[-1] : step, route.shape[-1] - 1])
+        route = route[..., keep]
+    return cities[route][..., 1:3]
+
+
+def _new_figure(figsize, save_path=None):
     """
-    Plots a single route.
+    Creates a pyplot figure, or a standalone Agg figure when the result is only
+    saved to disk (no GUI backend and no entry in pyplot's figure registry).
     """
-    plt.figure(figsize=(10, 8))
+    if save_path is None:
+        return plt.figure(figsize=figsize)
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def _show_or_save(figure, save_path=None):
+    if save_path is None:
+        plt.show()
+    else:
+        figure.savefig(save_path)
+
+
+def _annotate(ax, route, cities, eu_countries):
+    for city_idx in route:
+        ax.text(
+            cities[city_idx][1],
+            cities[city_idx][2],
+            eu_countries[int(cities[city_idx][0])],
+            fontsize=9,
+        )
+
+
+def plot_route(
+    route, cities, eu_countries=None, title="Route", max_points=None, save_path=None
+):
+    """
+    Plots a single route. If save_path is given the figure is rendered headless
+    to that file instead of being shown.
+    """
+    figure = _new_figure((10, 8), save_path)
+    ax = figure.add_subplot()
 
     # Extract x and y coordinates for all cities in the route
-    x_coords = [cities[city_idx][1] for city_idx in route]
-    y_coords = [cities[city_idx][2] for city_idx in route]
+    coords = route_coordinates(route, cities, max_points)
 
     # Plot the cities
-    plt.scatter(x_coords, y_coords, c="blue")
+    ax.scatter(coords[:, 0], coords[:, 1], c="blue")
 
     # Annotate each city with its name
     if eu_countries is not None:
-        for city_idx in route:
-            plt.text(
-                cities[city_idx][1],
-                cities[city_idx][2],
-                eu_countries[int(cities[city_idx][0])],
-                fontsize=9,
-            )
+        _annotate(ax, route, cities, eu_countries)
 
     # Plot the path
-    plt.plot(x_coords, y_coords, "r-", linewidth=1)
+    ax.plot(coords[:, 0], coords[:, 1], "r-", linewidth=1)
 
-    plt.title(title)
-    plt.xlabel("X Coordinate")
-    plt.ylabel("Y Coordinate")
-    plt.grid(True)
-    plt.show()
+    ax.set_title(title)
+    ax.set_xlabel("X Coordinate")
+    ax.set_ylabel("Y Coordinate")
+    ax.grid(True)
+    _show_or_save(figure, save_path)
 
 
 def plot_routes(
-    routes: np.ndarray, cities: np.array, eu_countries: np.array = None, title="Routes"
+    routes: np.ndarray,
+    cities: np.array,
+    eu_countries: np.array = None,
+    title="Routes",
+    max_routes: int = None,
+    max_points: int = None,
+    save_path: str = None,
 ):
     """
-    Plots all routes and prints the city names.
+    Plots all routes and prints the city names. The first route is highlighted
+    as the best one; the others are drawn as a single LineCollection, so
+    overlaying a whole population stays cheap. max_routes and max_points limit
+    the number of routes drawn and the cities kept per route.
     """
-    plt.figure(figsize=(10, 8))
+    routes = np.asarray(routes)
+    if max_routes is not None:
+        routes = routes[:max_routes]
 
-    for i, route in enumerate(routes):
-        x_coords = [cities[city_idx][1] for city_idx in route]
-        y_coords = [cities[city_idx][2] for city_idx in route]
+    figure = _new_figure((10, 8), save_path)
+    ax = figure.add_subplot()
 
-        if i == 0:
-            plt.scatter(x_coords, y_coords, c="blue")
-            plt.plot(x_coords, y_coords, "r-", linewidth=2, label=f"Route {i+1} (Best)")
-        else:
-            plt.plot(x_coords, y_coords, "grey", linewidth=1, alpha=0.7)
+    segments = route_coordinates(routes, cities, max_points)
+    if len(segments) > 1:
+        ax.add_collection(
+            LineCollection(segments[1:], colors="grey", linewidths=1, alpha=0.7)
+        )
+
+    best = segments[0]
+    ax.scatter(best[:, 0], best[:, 1], c="blue")
+    ax.plot(best[:, 0], best[:, 1], "r-", linewidth=2, label="Route 1 (Best)")
 
     if eu_countries is not None:
-        for city_idx in routes[0]:
-            plt.text(
-                cities[city_idx][1],
-                cities[city_idx][2],
-                eu_countries[int(cities[city_idx][0])],
-                fontsize=9,
-            )
-
-    plt.title(title, fontsize=16)
-    plt.xlabel("X Coordinate")
-    plt.ylabel("Y Coordinate")
-    plt.grid(True)
+        _annotate(ax, routes[0], cities, eu_countries)
+
+    ax.set_title(title, fontsize=16)
+    ax.set_xlabel("X Coordinate")
+    ax.set_ylabel("Y Coordinate")
+    ax.grid(True)
+
+    ax.legend()
+    _show_or_save(figure, save_path)
+
+
+def save_route_frames(
+    route_history,
+    cities,
+    directory: str,
+    fitness_history=None,
+    every: int = 1,
+    max_points: int = None,
+    filename: str = "frame_{:05d}.png",
+) -> List[str]:
+    """
+    Renders the best route of every `every`-th generation to PNG files in
+    `directory`, e.g. to assemble an animation with ffmpeg. A single Agg figure
+    is reused and only its line data is updated, so memory stays constant
+    regardless of the history length.
 
-    plt.legend()
-    plt.show()
+    Returns the paths of the written frames.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    figure = _new_figure((10, 8), save_path=directory)
+    ax = figure.add_subplot()
+    all_coords = cities[:, 1:3]
+    ax.scatter(all_coords[:, 0], all_coords[:, 1], c="blue", s=4)
+    (line,) = ax.plot([], [], "r-", linewidth=1)
+    ax.set_xlabel("X Coordinate")
+    ax.set_ylabel("Y Coordinate")
+    ax.grid(True)
+
+    paths = []
+    for generation in range(0, len(route_history), every):
+        coords = route_coordinates(route_history[generation], cities, max_points)
+        line.set_data(coords[:, 0], coords[:, 1])
+
+        title = f"Generation {generation}"
+        if fitness_history is not None:
+            title += f" - length {1 / fitness_history[generation]:.1f}"
+        ax.set_title(title)
+
+        path = os.path.join(directory, filename.format(generation))
+        figure.savefig(path)
+        paths.append(path)
+
+    return paths
 
 
 def plot_fitness(fitness_values, title="Best Fitness Over Generations"):
@@ -88,9 +192,6 @@ def plot_fitness(fitness_values, title="Best Fitness Over Generations"):
     plt.show()
 
 
-import matplotlib.pyplot as plt
-
-
 def plot_gridsearch_result(
     results: List[Result],
     param_name="Parameter",
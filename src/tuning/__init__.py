@@ -1,2 +1,22 @@
-from .result import *
-from .gridSearch import *
+from tools.lazy import lazy_module
+
+# Public names are resolved on first access (PEP 562).
+_LAZY_ATTRIBUTES = {
+    "Result": ".result",
+    "process_results": ".result",
+    "test_parameter_combination": ".gridSearch",
+    "gs_multithreading": ".gridSearch",
+    "gs_classic": ".gridSearch",
+    "search_grid": ".gridSearch",
+    "spawn_generators": ".gridSearch",
+    "tune_async": ".asyncTuner",
+    "TPESampler": ".asyncTuner",
+    "cost_adjusted_score": ".asyncTuner",
+    "ResultStore": ".store",
+    "import_results_csv": ".store",
+    "CostModel": ".costModel",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_module(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,198 @@
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import replace
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from genetics.parameters import Params
+from tuning.gridSearch import test_parameter_combination
+from tuning.result import Result, process_results
+from tuning.store import ResultStore
+
+
+def cost_adjusted_score(
+    result: Result, cost_weight: float = 0.01, max_duration: float = None
+) -> float:
+    """
+    Scores a result on a log scale: -log(length) - cost_weight * log(duration).
+
+    Tour lengths differ by a few percent while durations differ by orders of
+    magnitude, so both are compared as relative changes: with cost_weight=0.01,
+    doubling the duration must shorten the tour by about 0.7% to pay off.
+    cost_weight=0 ranks by fitness only. Failed runs, and runs longer than
+    max_duration seconds if given, score -inf.
+    """
+    if result.fitness is None or result.fitness <= 0 or result.duration <= 0:
+        return -np.inf
+    if max_duration is not None and result.duration > max_duration:
+        return -np.inf
+    return np.log(result.fitness) - cost_weight * np.log(result.duration)
+
+
+class TPESampler:
+    """
+    Tree-structured Parzen estimator over a discrete search space.
+
+    Completed trials are split into a "good" set (top `gamma` fraction by score) and a
+    "bad" set. For every parameter the choice frequencies of both sets (with a +1 prior)
+    give l(x) and g(x); candidates are drawn from l and the one maximising l(x) / g(x)
+    is proposed. Until `n_startup` trials have completed, proposals are random.
+    """
+
+    def __init__(
+        self,
+        space: Dict[str, List],
+        rng: np.random.Generator,
+        n_startup: int = 10,
+        gamma: float = 0.25,
+        n_candidates: int = 24,
+    ):
+        self.space = space
+        self.rng = rng
+        self.n_startup = n_startup
+        self.gamma = gamma
+        self.n_candidates = n_candidates
+        self.observations: List[tuple] = []  # (choice indices, score)
+
+    def random_choice(self) -> Dict[str, int]:
+        return {
+            name: self.rng.integers(len(values)) for name, values in self.space.items()
+        }
+
+    def observe(self, choice: Dict[str, int], score: float):
+        self.observations.append((choice, score))
+
+    def propose(self) -> Dict[str, int]:
+        if len(self.observations) < self.n_startup:
+            return self.random_choice()
+
+        scores = np.array([score for _, score in self.observations])
+        n_good = max(1, int(np.ceil(self.gamma * len(scores))))
+        order = np.argsort(scores)[::-1]
+        good = [self.observations[i][0] for i in order[:n_good]]
+        bad = [self.observations[i][0] for i in order[n_good:]]
+
+        densities = {}
+        for name, values in self.space.items():
+            k = len(values)
+            good_counts = np.bincount([c[name] for c in good], minlength=k) + 1
+            bad_counts = np.bincount([c[name] for c in bad], minlength=k) + 1
+            densities[name] = (
+                good_counts / good_counts.sum(),
+                bad_counts / bad_counts.sum(),
+            )
+
+        best_choice, best_ratio = None, -np.inf
+        for _ in range(self.n_candidates):
+            choice = {
+                name: self.rng.choice(len(values), p=densities[name][0])
+                for name, values in self.space.items()
+            }
+            ratio = sum(
+                np.log(densities[name][0][i]) - np.log(densities[name][1][i])
+                for name, i in choice.items()
+            )
+            if ratio > best_ratio:
+                best_choice, best_ratio = choice, ratio
+        return best_choice
+
+    def to_params(self, choice: Dict[str, int], base: Params = None) -> Params:
+        values = {name: self.space[name][i] for name, i in choice.items()}
+        return replace(base, **values) if base is not None else Params(**values)
+
+
+def tune_async(
+    cities: np.ndarray,
+    space: Dict[str, List],
+    genetic_algorithm: Callable,
+    time_budget: float,
+    base_params: Params = None,
+    max_workers: int = None,
+    n_startup: int = None,
+    cost_weight: float = 0.01,
+    max_trial_duration: float = None,
+    seed: int = None,
+    store: ResultStore = None,
+) -> List[Result]:
+    """
+    Tunes Params asynchronously with a TPE surrogate instead of a full grid.
+
+    A process pool is kept saturated: as soon as any trial completes, its Result is fed
+    to the sampler and a new proposal is submitted, so there are no synchronous rounds.
+    Trials are ranked by cost_adjusted_score, which trades the relative tour length
+    against the relative duration.
+    No new trial is submitted once time_budget (seconds) is spent; trials still running
+    at that point are waited for.
+
+    Args:
+        cities: The dataset of cities.
+        space: Candidate values per Params field, e.g. {"population_size": [50, 100]}.
+        genetic_algorithm: Function that runs the genetic algorithm.
+        time_budget: Total wall-clock budget in seconds.
+        base_params: Values for the Params fields that are not in space.
+        max_workers: Size of the process pool, default is os.cpu_count().
+        n_startup: Number of random trials before the surrogate is used,
+                   default is max(10, number of workers).
+        cost_weight: Weight of log(duration) in the score (0 = fitness only).
+        max_trial_duration: Optional per-trial cost cap in seconds; with
+                            cost_weight=0 the tuner maximises quality under the cap.
+        seed: Seed of the sampler and of the per-trial generators.
+        store: Optional ResultStore; each result is appended as soon as it completes.
+
+    Returns:
+        List[Result]: All completed results, best cost_adjusted_score first.
+    """
+    seed_sequence = np.random.SeedSequence(seed)
+    sampler_seed, trial_seeds = seed_sequence.spawn(2)
+    sampler = TPESampler(space, np.random.default_rng(sampler_seed))
+
+    results = []
+    start_time = time.time()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        workers = executor._max_workers
+        sampler.n_startup = n_startup if n_startup is not None else max(10, workers)
+        logging.info(f"Async tuning with {workers} workers for {time_budget:.0f}s...")
+        running = {}
+
+        def submit():
+            choice = sampler.propose()
+            params = sampler.to_params(choice, base_params)
+            rng = np.random.default_rng(trial_seeds.spawn(1)[0])
+            future = executor.submit(
+                test_parameter_combination, params, cities, genetic_algorithm, rng
+            )
+            running[future] = choice
+
+        for _ in range(workers):
+            submit()
+
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                choice = running.pop(future)
+                result = future.result()
+                results.append(result)
+                sampler.observe(
+                    choice, cost_adjusted_score(result, cost_weight, max_trial_duration)
+                )
+                if store is not None:
+                    store.append(result)
+                if time.time() - start_time < time_budget:
+                    submit()
+
+    if store is not None:
+        store.flush()
+    logging.info(
+        f"Async tuning evaluated {len(results)} trials in "
+        f"{time.time() - start_time:.2f} seconds."
+    )
+    results = sorted(
+        process_results(results),
+        key=lambda r: cost_adjusted_score(r, cost_weight, max_trial_duration),
+        reverse=True,
+    )
+    if results:
+        logging.info(f"Best cost-adjusted parameters: {results[0].params}")
+    return results
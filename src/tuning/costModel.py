@@ -0,0 +1,251 @@
+from dataclasses import replace
+from itertools import product
+from statistics import NormalDist
+from typing import Dict, List
+
+import numpy as np
+
+from genetics import Params
+from tuning.result import Result
+from tuning.store import PARAM_FIELDS, ResultStore
+
+NUMERIC_FEATURES = ("population_size", "elite_size", "tournament_size")
+CATEGORICAL_FEATURES = ("crossover_type", "mutation_type", "initial_population")
+
+# Prior log-log exponents of the runtime: linear in population, generations and cities
+RUNTIME_PRIOR = {"population_size": 1.0, "generations": 1.0, "num_cities": 1.0}
+
+
+class CostModel:
+    """
+    Runtime and quality model of the genetic algorithm, fitted on stored Results.
+
+    Both models are ridge regressions on log(population_size), log(generations),
+    log(num_cities), log(elite_size), log(tournament_size), mutation_rate and one-hot
+    operator choices:
+    - runtime: log(duration), shrunk towards duration ~ population * generations *
+      cities for directions the history does not cover (e.g. a single instance size);
+    - quality: log(gap), the tour length over the best length stored for the same
+      number of cities.
+
+    recommend() turns both into the Params with the best predicted quality whose
+    predicted duration fits a wall-clock budget. Durations are those of the machine
+    that produced the history; calibrate() adjusts them to another machine.
+
+    Usage:
+        import_results_csv("../data/results.csv", store)
+        params = CostModel.from_store(store).recommend(len(cities), time_budget=5.0)
+    """
+
+    def __init__(self, ridge: float = 1.0):
+        self.ridge = ridge
+        self.levels: Dict[str, List] = {}
+        self.space: Dict[str, List] = {}
+        self.runtime_weights = None
+        self.quality_weights = None
+        self.runtime_sigma = 0.0
+        self.max_generations = None
+
+    @classmethod
+    def from_results(cls, results: List[Result], ridge: float = 1.0) -> "CostModel":
+        """
+        Fits the model on Results; num_cities is taken from each (closed) best route.
+        """
+        results = [
+            r
+            for r in results
+            if r.stop_reason == "completed" and r.fitness > 0 and r.duration > 0
+        ]
+        columns = {
+            name: np.array([getattr(r.params, name) for r in results])
+            for name in PARAM_FIELDS
+        }
+        columns["fitness"] = np.array([r.fitness for r in results], dtype=float)
+        columns["duration"] = np.array([r.duration for r in results], dtype=float)
+        columns["num_cities"] = np.array([len(r.best_route) - 1 for r in results])
+        return cls(ridge).fit(columns)
+
+    @classmethod
+    def from_store(cls, store: ResultStore, ridge: float = 1.0) -> "CostModel":
+        """
+        Fits the model on the index columns of a ResultStore, without reading routes.
+        """
+        index = store.index()
+        mask = (index["fitness"] > 0) & (index["duration"] > 0)
+        if "stop_reason" in index:
+            mask &= index["stop_reason"] == "completed"
+        columns = {name: values[mask] for name, values in index.items()}
+        columns["num_cities"] = columns["route_length"] - 1
+        return cls(ridge).fit(columns)
+
+    def fit(self, columns: Dict[str, np.ndarray]) -> "CostModel":
+        if len(columns["fitness"]) < 2:
+            raise ValueError("At least two completed results are needed")
+
+        defaults = Params(1, 1, 1, 1, 0.0)
+        for name in PARAM_FIELDS:
+            if name not in columns:
+                columns[name] = np.full(
+                    len(columns["fitness"]), getattr(defaults, name)
+                )
+        self.levels = {
+            name: sorted(np.unique(columns[name]).tolist())
+            for name in CATEGORICAL_FEATURES
+        }
+        self.space = {
+            name: sorted(np.unique(columns[name]).tolist())
+            for name in (*NUMERIC_FEATURES, "mutation_rate", *CATEGORICAL_FEATURES)
+        }
+        self.max_generations = int(2 * columns["generations"].max())
+
+        features = self._features(columns)
+
+        # Runtime: ridge towards the prior exponents, intercept left free
+        prior = np.zeros(features.shape[1])
+        for name, exponent in RUNTIME_PRIOR.items():
+            prior[self.feature_names.index(name)] = exponent
+        self.runtime_weights = self._ridge(features, np.log(columns["duration"]), prior)
+        residuals = np.log(columns["duration"]) - features @ self.runtime_weights
+        self.runtime_sigma = float(residuals.std())
+
+        # Quality: gap to the best stored tour of the same instance size
+        best_fitness = {
+            n: columns["fitness"][columns["num_cities"] == n].max()
+            for n in np.unique(columns["num_cities"])
+        }
+        gap = (
+            np.array([best_fitness[n] for n in columns["num_cities"]])
+            / columns["fitness"]
+        )
+        self.quality_weights = self._ridge(
+            features, np.log(gap), np.zeros(features.shape[1])
+        )
+        return self
+
+    @property
+    def feature_names(self) -> List[str]:
+        names = ["intercept", "generations", "num_cities", *NUMERIC_FEATURES]
+        names.append("mutation_rate")
+        for name in CATEGORICAL_FEATURES:
+            names.extend(f"{name}={level}" for level in self.levels[name][1:])
+        return names
+
+    def _features(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        blocks = [
+            np.ones(len(columns["generations"])),
+            np.log(columns["generations"]),
+            np.log(columns["num_cities"]),
+        ]
+        blocks.extend(np.log(columns[name]) for name in NUMERIC_FEATURES)
+        blocks.append(np.asarray(columns["mutation_rate"], dtype=float))
+        for name in CATEGORICAL_FEATURES:
+            blocks.extend(
+                (np.asarray(columns[name]) == level).astype(float)
+                for level in self.levels[name][1:]
+            )
+        return np.column_stack(blocks)
+
+    def _ridge(
+        self, features: np.ndarray, target: np.ndarray, prior: np.ndarray
+    ) -> np.ndarray:
+        penalty = self.ridge * np.eye(features.shape[1])
+        penalty[0, 0] = 0.0
+        return np.linalg.solve(
+            features.T @ features + penalty,
+            features.T @ target + penalty @ prior,
+        )
+
+    def _columns(self, params: Params, num_cities: int) -> Dict[str, np.ndarray]:
+        columns = {name: np.array([getattr(params, name)]) for name in PARAM_FIELDS}
+        columns["num_cities"] = np.array([num_cities])
+        return columns
+
+    def predict_duration(
+        self, params: Params, num_cities: int, confidence: float = 0.5
+    ) -> float:
+        """
+        Predicted duration in seconds; confidence > 0.5 gives an upper quantile.
+        """
+        features = self._features(self._columns(params, num_cities))
+        z = NormalDist().inv_cdf(confidence)
+        return float(
+            np.exp(features @ self.runtime_weights + z * self.runtime_sigma)[0]
+        )
+
+    def calibrate(self, results: List[Result]) -> "CostModel":
+        """
+        Rescales the runtime model to this machine with a few Results measured on it.
+        """
+        residuals = [
+            np.log(r.duration)
+            - np.log(self.predict_duration(r.params, len(r.best_route) - 1))
+            for r in results
+            if r.stop_reason == "completed" and r.duration > 0
+        ]
+        if residuals:
+            self.runtime_weights[0] += float(np.mean(residuals))
+        return self
+
+    def predict_gap(self, params: Params, num_cities: int) -> float:
+        """
+        Predicted tour length relative to the best stored length (1.0 = as good).
+        """
+        features = self._features(self._columns(params, num_cities))
+        return float(np.exp(features @ self.quality_weights)[0])
+
+    def recommend(
+        self,
+        num_cities: int,
+        time_budget: float,
+        space: Dict[str, List] = None,
+        base_params: Params = None,
+        confidence: float = 0.9,
+        min_generations: int = 10,
+    ) -> Params:
+        """
+        Recommends Params for an instance of num_cities cities and a time budget.
+
+        Every combination of the candidate values (by default the values seen in the
+        history) gets the largest number of generations whose `confidence` quantile
+        of the predicted duration fits time_budget; the combination with the best
+        predicted quality wins. Operators absent from the history are never proposed
+        unless listed in space, since the model knows nothing about them.
+
+        Raises ValueError if no combination fits the budget with min_generations.
+        """
+        space = {**self.space, **(space or {})}
+        space.pop("generations", None)
+        base_params = base_params if base_params is not None else Params(1, 1, 1, 1, 0)
+        generations_index = self.feature_names.index("generations")
+        z = NormalDist().inv_cdf(confidence)
+
+        best, best_gap = None, np.inf
+        names = list(space)
+        for values in product(*(space[name] for name in names)):
+            params = replace(base_params, generations=1, **dict(zip(names, values)))
+            if params.elite_size >= params.population_size:
+                continue
+
+            # log(duration) is linear in log(generations): solve for the budget
+            features = self._features(self._columns(params, num_cities))
+            slope = self.runtime_weights[generations_index]
+            base = (features @ self.runtime_weights)[0] + z * self.runtime_sigma
+            generations = (
+                np.exp((np.log(time_budget) - base) / slope)
+                if slope > 0
+                else self.max_generations
+            )
+            generations = int(min(generations, self.max_generations))
+            if generations < min_generations:
+                continue
+
+            params = replace(params, generations=generations)
+            gap = self.predict_gap(params, num_cities)
+            if gap < best_gap:
+                best, best_gap = params, gap
+
+        if best is None:
+            raise ValueError(
+                f"No parameters fit a budget of {time_budget}s for {num_cities} cities"
+            )
+        return best
@@ -2,15 +2,22 @@ import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Callable
 from genetics.parameters import Params
+from genetics.solutions import SolutionStore
 from tools.log import print_estimated_time
+from tools.metrics import MetricsExporter
 from tuning.result import Result
 from .result import process_results
+from .store import ResultStore
 import numpy as np
 import logging
 
 
 def test_parameter_combination(
-    params: Params, cities: np.ndarray, genetic_algorithm: callable
+    params: Params,
+    cities: np.ndarray,
+    genetic_algorithm: callable,
+    rng: np.random.Generator = None,
+    solutions: SolutionStore = None,
 ) -> Result:
     """
     Runs the genetic algorithm for a given set of parameters.
@@ -19,6 +26,8 @@ def test_parameter_combination(
         params: Parameter set for the genetic algorithm.
         cities: The dataset of cities (e.g., for TSP).
         genetic_algorithm: Function that executes the genetic algorithm.
+        rng: Optional random number generator passed to genetic_algorithm.
+        solutions: Optional SolutionStore the best route is added to.
 
     Returns:
         dict: A dictionary containing the parameters, the best fitness, and the best route.
@@ -26,8 +35,11 @@ def test_parameter_combination(
     start_time = time.time()
 
     try:
-        best_route, best_fitness, _, _ = genetic_algorithm(cities, params)
+        kwargs = {} if rng is None else {"rng": rng}
+        best_route, best_fitness, _, _ = genetic_algorithm(cities, params, **kwargs)
         duration = time.time() - start_time
+        if solutions is not None:
+            solutions.add(cities, best_route)
         return Result(
             params=params,
             fitness=best_fitness,
@@ -38,25 +50,59 @@ def test_parameter_combination(
     except Exception as e:
         logging.error(f"Error with params {params}: {e}")
         return Result(
-            params=params, fitness=-1.0, best_route=np.zeros(()), duration=-1.0
+            params=params,
+            fitness=-1.0,
+            best_route=np.zeros(()),
+            duration=-1.0,
+            stop_reason="error",
         )
 
 
+def spawn_generators(seed, count: int) -> List[np.random.Generator]:
+    """
+    Creates `count` independent generators from one seed with SeedSequence.spawn,
+    so every run has its own stream regardless of scheduling order.
+    Without a seed, returns `count` Nones so that no rng is passed to the runs.
+    """
+    if seed is None:
+        return [None] * count
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(count)]
+
+
+def _best_length(best_length, result: Result):
+    if result.fitness is None or result.fitness <= 0:
+        return best_length
+    length = 1 / result.fitness
+    return length if best_length is None else min(best_length, length)
+
+
 def gs_multithreading(
     cities: np.ndarray,
     param_combinations: List[Params],
     genetic_algorithm: Callable,
     timeout: int = None,
+    store: ResultStore = None,
+    seed: int = None,
+    metrics: MetricsExporter = None,
+    solutions: SolutionStore = None,
 ):
     results = []
+    rngs = spawn_generators(seed, len(param_combinations))
+    start_time = time.time()
+    best_length = None
 
     with ThreadPoolExecutor() as executor:
         logging.info(f"Number of available workers: {executor._max_workers}")
         future_to_params = {
             executor.submit(
-                test_parameter_combination, params, cities, genetic_algorithm
+                test_parameter_combination,
+                params,
+                cities,
+                genetic_algorithm,
+                rng,
+                solutions,
             ): params
-            for params in param_combinations
+            for params, rng in zip(param_combinations, rngs)
         }
 
         for combination_index, future in enumerate(as_completed(future_to_params), 1):
@@ -65,6 +111,18 @@ def gs_multithreading(
             try:
                 result = future.result(timeout=timeout)
                 results.append(result)
+                if store is not None:
+                    store.append(result)
+                if metrics is not None:
+                    best_length = _best_length(best_length, result)
+                    metrics.search_progress(
+                        "search_grid",
+                        combination_index,
+                        len(param_combinations),
+                        start_time,
+                        executor._max_workers,
+                        best_length,
+                    )
 
             except Exception as e:
                 logging.error(f"Error processing parameters {params}: {str(e)}")
@@ -76,22 +134,36 @@ def gs_classic(
     param_combinations: List[Params],
     genetic_algorithm: Callable,
     _: int = None,
+    store: ResultStore = None,
+    seed: int = None,
+    metrics: MetricsExporter = None,
+    solutions: SolutionStore = None,
 ):
     results = []
+    rngs = spawn_generators(seed, len(param_combinations))
     start_time = time.time()
     total_combinations = len(param_combinations)
     intervals_logged = 0
     index = 0
+    best_length = None
 
-    for params in param_combinations:
+    for params, rng in zip(param_combinations, rngs):
         try:
-            results.append(
-                test_parameter_combination(params, cities, genetic_algorithm)
+            result = test_parameter_combination(
+                params, cities, genetic_algorithm, rng, solutions
             )
+            results.append(result)
+            if store is not None:
+                store.append(result)
             index += 1
             intervals_logged = print_estimated_time(
                 index, total_combinations, start_time, intervals_logged
             )
+            if metrics is not None:
+                best_length = _best_length(best_length, result)
+                metrics.search_progress(
+                    "search_grid", index, total_combinations, start_time, 1, best_length
+                )
         except Exception as e:
             logging.error(f"Error processing parameters {params}: {str(e)}")
     return results
@@ -103,6 +175,10 @@ def search_grid(
     genetic_algorithm: Callable,
     multithreading: bool = False,
     timeout: int = None,
+    store: ResultStore = None,
+    seed: int = None,
+    metrics: MetricsExporter = None,
+    solutions: SolutionStore = None,
 ) -> List[Result]:
     """
     Runs parameter tuning using a genetic algorithm over a list of parameter combinations.
@@ -115,6 +191,14 @@ def search_grid(
         timeout: Optional timeout for each task (in seconds).
         multithreading: Boolean flag to enable multithreading (parallel execution).
                         If False, the function runs sequentially.
+        store: Optional ResultStore; each result is appended as soon as it completes.
+        seed: Optional seed; each combination gets its own spawned generator,
+              so results are reproducible with or without multithreading. Without
+              a seed, genetic_algorithm is called as genetic_algorithm(cities, params).
+        metrics: Optional MetricsExporter; progress, queue depth, ETA and the best
+                 length so far are published under run="search_grid".
+        solutions: Optional SolutionStore; every combination's best route is added.
+                   Runs are not seeded from it, so combinations stay comparable.
 
     Returns:
         List[Dict]: A list of results sorted by fitness, containing the parameter set,
@@ -126,10 +210,30 @@ def search_grid(
     )
     start_time = time.time()
     res = (
-        gs_multithreading(cities, param_combinations, genetic_algorithm, timeout)
+        gs_multithreading(
+            cities,
+            param_combinations,
+            genetic_algorithm,
+            timeout,
+            store,
+            seed,
+            metrics,
+            solutions,
+        )
         if multithreading
-        else gs_classic(cities, param_combinations, genetic_algorithm, timeout)
+        else gs_classic(
+            cities,
+            param_combinations,
+            genetic_algorithm,
+            timeout,
+            store,
+            seed,
+            metrics,
+            solutions,
+        )
     )
+    if store is not None:
+        store.flush()
     total_duration = time.time() - start_time
     logging.info(f"Parameter tuning completed in {total_duration:.2f} seconds.")
     return process_results(res)
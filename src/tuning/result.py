@@ -13,6 +13,7 @@ class Result:
     fitness: float
     best_route: np.ndarray
     duration: float
+    stop_reason: str = "completed"
 
 
 def process_results(results: List[Result]) -> List[Result]:
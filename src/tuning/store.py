@@ -0,0 +1,204 @@
+import ast
+import csv
+import glob
+import os
+from dataclasses import fields
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from genetics import Params
+from tuning.result import Result
+
+ROUTE_DTYPE = np.int32
+PARAM_FIELDS = [field.name for field in fields(Params)]
+
+
+class ResultStore:
+    """
+    Append-only, columnar store for grid-search results.
+
+    Layout of the store directory:
+    - routes.bin: every best route packed back to back as int32.
+    - index_XXXXX.npz: one file per flushed chunk, holding one column per Params
+      field plus fitness, duration, stop_reason, route_offset and route_length.
+
+    Queries only read the small index columns; routes are read from a memory map
+    for the rows that are actually requested.
+    """
+
+    def __init__(self, directory: str, flush_every: int = 100):
+        self.directory = directory
+        self.flush_every = flush_every
+        self._buffer: List[Result] = []
+        self._index = None
+        os.makedirs(directory, exist_ok=True)
+
+        self._routes_path = os.path.join(directory, "routes.bin")
+        self._routes_file = open(self._routes_path, "ab")
+        self._next_chunk = len(self._chunk_paths())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.index()["fitness"]) + len(self._buffer)
+
+    def _chunk_paths(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.directory, "index_*.npz")))
+
+    def append(self, result: Result):
+        """
+        Buffers a result; the buffer is written to disk every `flush_every` results.
+        """
+        self._buffer.append(result)
+        if len(self._buffer) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered routes to routes.bin and their index columns to a new chunk.
+        """
+        if not self._buffer:
+            return
+
+        offset = self._routes_file.tell() // np.dtype(ROUTE_DTYPE).itemsize
+        offsets, lengths = [], []
+        for result in self._buffer:
+            route = np.asarray(result.best_route, dtype=ROUTE_DTYPE)
+            if route.ndim == 0:  # failed runs carry an empty placeholder route
+                route = np.empty(0, dtype=ROUTE_DTYPE)
+            self._routes_file.write(route.tobytes())
+            offsets.append(offset)
+            lengths.append(len(route))
+            offset += len(route)
+        self._routes_file.flush()
+
+        columns = {
+            name: np.asarray([getattr(r.params, name) for r in self._buffer])
+            for name in PARAM_FIELDS
+        }
+        columns["fitness"] = np.array([r.fitness for r in self._buffer], dtype=float)
+        columns["duration"] = np.array([r.duration for r in self._buffer], dtype=float)
+        columns["stop_reason"] = np.array([r.stop_reason for r in self._buffer])
+        columns["route_offset"] = np.array(offsets, dtype=np.int64)
+        columns["route_length"] = np.array(lengths, dtype=np.int64)
+
+        path = os.path.join(self.directory, f"index_{self._next_chunk:05d}.npz")
+        np.savez(path, **columns)
+        self._next_chunk += 1
+        self._buffer = []
+        self._index = None
+
+    def close(self):
+        self.flush()
+        self._routes_file.close()
+
+    def index(self) -> Dict[str, np.ndarray]:
+        """
+        Returns every index column (no routes), concatenated over all flushed chunks.
+        """
+        if self._index is None:
+            chunks = []
+            for path in self._chunk_paths():
+                with np.load(path) as chunk:
+                    chunks.append({name: chunk[name] for name in chunk.files})
+            names = list(chunks[0]) if chunks else []
+            names = [name for name in names if all(name in c for c in chunks)]
+            self._index = {
+                name: np.concatenate([chunk[name] for chunk in chunks])
+                for name in names
+            }
+            self._index.setdefault("fitness", np.empty(0))
+        return self._index
+
+    def query(
+        self,
+        where: Callable[[Dict[str, np.ndarray]], np.ndarray] = None,
+        top_k: int = None,
+        by: str = "fitness",
+        ascending: bool = False,
+        **equals,
+    ) -> np.ndarray:
+        """
+        Returns the row ids matching the filters, sorted by `by` (descending by default).
+
+        Args:
+            where: Function taking the index columns and returning a boolean mask.
+            top_k: Only return the first top_k rows.
+            by: Column used for sorting.
+            ascending: Sort in ascending order, e.g. by="duration" for the fastest runs.
+            equals: Column equality filters, e.g. crossover_type="ox".
+        """
+        index = self.index()
+        mask = np.ones(len(index["fitness"]), dtype=bool)
+        for name, value in equals.items():
+            mask &= index[name] == value
+        if where is not None:
+            mask &= where(index)
+
+        rows = np.nonzero(mask)[0]
+        order = np.argsort(index[by][rows], kind="stable")
+        rows = rows[order if ascending else order[::-1]]
+        return rows[:top_k] if top_k is not None else rows
+
+    def route(self, row: int) -> np.ndarray:
+        """
+        Reads the route of one row from routes.bin.
+        """
+        index = self.index()
+        offset, length = index["route_offset"][row], index["route_length"][row]
+        routes = np.memmap(self._routes_path, dtype=ROUTE_DTYPE, mode="r")
+        return np.array(routes[offset : offset + length], dtype=int)
+
+    def results(self, rows) -> List[Result]:
+        """
+        Rebuilds full Result objects (including routes) for the given rows.
+        """
+        index = self.index()
+        results = []
+        for row in rows:
+            # Params fields missing from older chunks fall back to their defaults
+            params = Params(
+                **{
+                    name: index[name][row].item()
+                    for name in PARAM_FIELDS
+                    if name in index
+                }
+            )
+            results.append(
+                Result(
+                    params=params,
+                    fitness=index["fitness"][row].item(),
+                    best_route=self.route(row),
+                    duration=index["duration"][row].item(),
+                    stop_reason=str(index["stop_reason"][row]),
+                )
+            )
+        return results
+
+
+def import_results_csv(file_path: str, store: ResultStore) -> int:
+    """
+    Imports a legacy results CSV (params as dict repr, routes as NumPy repr) into a store.
+    Returns the number of imported results.
+    """
+    count = 0
+    with open(file_path, newline="") as file:
+        for row in csv.DictReader(file):
+            params = ast.literal_eval(row["params"])
+            route = np.array(row["best_route"].strip("[]").split(), dtype=int)
+            store.append(
+                Result(
+                    params=Params(**params),
+                    fitness=float(row["fitness"]),
+                    best_route=route,
+                    duration=float(row["duration"]),
+                )
+            )
+            count += 1
+    store.flush()
+    return count